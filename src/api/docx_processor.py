@@ -1,7 +1,8 @@
 import os
 import logging
 from typing import List, Dict, Any
-import docx
+
+from src.core.word_counter import WordCounter
 
 class DocxProcessor:
     @staticmethod
@@ -23,23 +24,38 @@ class DocxProcessor:
                 logging.error(f"Verzeichnis nicht gefunden: {directory}")
                 return documents
 
-            # Alle Dateien im Verzeichnis durchsuchen
-            for filename in os.listdir(directory):
-                if filename.lower().endswith('.docx'):
-                    filepath = os.path.join(directory, filename)
-                    
+            # Alle DOCX-Dateien im Verzeichnis per Iterator durchsuchen
+            # (leere Dateien scheitern beim Lesen und werden dort protokolliert)
+            with os.scandir(directory) as entries:
+                docx_entries = [
+                    entry for entry in entries
+                    if entry.name.lower().endswith('.docx') and entry.is_file()
+                ]
+            
+            for entry in docx_entries:
+                filename = entry.name
+                filepath = entry.path
+                
+                try:
                     try:
-                        doc = docx.Document(filepath)
-                        full_text = '\n'.join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
+                        # Absätze per lxml-Streaming statt python-docx-DOM lesen
+                        paragraph_texts = list(WordCounter.iter_paragraphs(filepath))
+                    except Exception:
+                        # python-docx nur für den Fallback laden
+                        import docx
                         
-                        documents.append({
-                            'filename': filename,
-                            'path': filepath,
-                            'text': full_text,
-                            'word_count': len(full_text.split())
-                        })
-                    except Exception as doc_error:
-                        logging.error(f"Fehler beim Lesen von {filename}: {doc_error}")
+                        doc = docx.Document(filepath)
+                        paragraph_texts = (paragraph.text for paragraph in doc.paragraphs)
+                    full_text = '\n'.join(text for text in paragraph_texts if text.strip())
+                    
+                    documents.append({
+                        'filename': filename,
+                        'path': filepath,
+                        'text': full_text,
+                        'word_count': len(full_text.split())
+                    })
+                except Exception as doc_error:
+                    logging.error(f"Fehler beim Lesen von {filename}: {doc_error}")
         
         except PermissionError:
             logging.error(f"Keine Berechtigung, Verzeichnis zu lesen: {directory}")
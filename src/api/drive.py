@@ -2,8 +2,13 @@
 Google Drive API-Integration für den Zugriff auf DOCX-Dokumente.
 """
 import os
+import json
+import logging
 import pickle
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from google.auth.transport.requests import Request
@@ -13,55 +18,171 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 import io
 
+# Chunk- und Puffergröße für Downloads (weniger HTTPS-Roundtrips pro Datei)
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 # Berechtigungen, die für den Zugriff auf Google Drive benötigt werden
 SCOPES = [
     'https://www.googleapis.com/auth/drive.metadata.readonly',
     'https://www.googleapis.com/auth/drive.readonly'
 ]
 
+def _escape_query_value(value: str) -> str:
+    """
+    Maskiert einen Wert für ein String-Literal in einer Drive-Suchanfrage (q).
+    
+    Args:
+        value: Unmaskierter Wert
+    
+    Returns:
+        Wert mit maskierten Backslashes und Apostrophen
+    """
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+def _migrate_pickle_token(token_path: str) -> Optional[Credentials]:
+    """
+    Übernimmt ein Token aus dem früheren Format token.pickle einmalig als JSON.
+    
+    Bestehende Installationen müssen sich so nach der Umstellung auf
+    token.json nicht erneut im Browser anmelden.
+    
+    Args:
+        token_path: Pfad zur token.json-Datei
+    
+    Returns:
+        Anmeldeinformationen aus token.pickle oder None, falls keine vorhanden sind
+    """
+    pickle_path = os.path.join(os.path.dirname(token_path), 'token.pickle')
+    if not os.path.exists(pickle_path):
+        return None
+    
+    try:
+        # Nur die von dieser Anwendung selbst geschriebene Token-Datei entpicklen
+        with open(pickle_path, 'rb') as token:
+            creds = pickle.load(token)
+        with open(token_path, 'w', encoding='utf-8') as token:
+            token.write(creds.to_json())
+        return creds
+    except Exception as e:
+        logging.warning(f"token.pickle konnte nicht übernommen werden, neue Anmeldung nötig: {e}")
+        return None
+
+# Drive-Services je Thread (httplib2 ist nicht threadsicher)
+_thread_local = threading.local()
+
+@lru_cache(maxsize=None)
+def _load_credentials(credentials_path: str, token_path: str) -> Credentials:
+    """
+    Authentifiziert den Benutzer einmalig pro Prozess bei der Google Drive API.
+    
+    Args:
+        credentials_path: Pfad zur credentials.json-Datei
+        token_path: Pfad zur token.json-Datei
+    
+    Returns:
+        Gültige Anmeldeinformationen
+    """
+    creds = None
+    
+    # Token aus der JSON-Datei laden, falls vorhanden
+    if os.path.exists(token_path):
+        with open(token_path, 'r', encoding='utf-8') as token:
+            creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
+    else:
+        creds = _migrate_pickle_token(token_path)
+    
+    # Wenn keine gültigen Anmeldeinformationen verfügbar sind, den Benutzer anmelden lassen
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, SCOPES)
+            creds = flow.run_local_server(port=0)
+        
+        # Token für die zukünftige Verwendung speichern
+        with open(token_path, 'w', encoding='utf-8') as token:
+            token.write(creds.to_json())
+    
+    return creds
+
+def _get_drive_service(credentials_path: str, token_path: str):
+    """
+    Liefert den Drive API-Service des aktuellen Threads und baut ihn bei Bedarf.
+    
+    Das eingebettete Discovery-Dokument wird verwendet, sodass kein HTTPS-Abruf
+    nötig ist; die Credentials werden prozessweit geteilt.
+    
+    Args:
+        credentials_path: Pfad zur credentials.json-Datei
+        token_path: Pfad zur token.json-Datei
+    
+    Returns:
+        Drive API-Service
+    """
+    services = getattr(_thread_local, 'services', None)
+    if services is None:
+        services = _thread_local.services = {}
+    key = (credentials_path, token_path)
+    
+    if key not in services:
+        services[key] = build(
+            'drive', 'v3',
+            credentials=_load_credentials(credentials_path, token_path),
+            cache_discovery=False,
+            static_discovery=True
+        )
+    return services[key]
+
 class GoogleDriveClient:
     """
     Client für die Interaktion mit der Google Drive API.
     """
-    def __init__(self, credentials_path: str = 'credentials.json', token_path: str = 'token.pickle'):
+    def __init__(self, credentials_path: str = 'credentials.json', token_path: str = 'token.json'):
         """
         Initialisiert den Google Drive Client.
         
+        Die Authentifizierung erfolgt erst beim ersten Zugriff auf den Service.
+        
         Args:
             credentials_path: Pfad zur credentials.json-Datei
-            token_path: Pfad zur token.pickle-Datei
+            token_path: Pfad zur token.json-Datei
         """
         self.credentials_path = credentials_path
         self.token_path = token_path
-        self.service = None
-        self._authenticate()
     
-    def _authenticate(self) -> None:
+    @property
+    def service(self):
         """
-        Authentifiziert den Benutzer bei der Google Drive API.
+        Drive API-Service für den aktuellen Thread (lazy, prozessweit gecacht).
         """
-        creds = None
-        
-        # Token aus der Datei laden, falls vorhanden
-        if os.path.exists(self.token_path):
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+        return _get_drive_service(self.credentials_path, self.token_path)
+    
+    def _iter_files(self, query: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Liefert alle Dateien zu einer Suchanfrage über sämtliche Ergebnisseiten.
         
-        # Wenn keine gültigen Anmeldeinformationen verfügbar sind, den Benutzer anmelden lassen
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_path, SCOPES)
-                creds = flow.run_local_server(port=0)
+        Args:
+            query: Drive-Suchanfrage (q-Parameter)
+            page_size: Anzahl der Ergebnisse pro Seite
             
-            # Token für die zukünftige Verwendung speichern
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        # Drive API-Service erstellen
-        self.service = build('drive', 'v3', credentials=creds)
+        Yields:
+            Dateien mit den von den Aufrufern benötigten Feldern (id, name)
+        """
+        page_token = None
+        while True:
+            response = self.service.files().list(
+                q=query,
+                pageSize=page_size,
+                pageToken=page_token,
+                fields="nextPageToken, files(id, name)"
+            ).execute()
+            
+            yield from response.get('files', [])
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
     
     def list_docx_files(self, folder_id: Optional[str] = None, page_size: int = 100) -> List[Dict[str, Any]]:
         """
@@ -72,51 +193,91 @@ class GoogleDriveClient:
             page_size: Anzahl der Ergebnisse pro Seite
             
         Returns:
-            Liste von DOCX-Dateien mit Metadaten
+            Liste aller DOCX-Dateien (id, name) über alle Ergebnisseiten
         """
         query = "mimeType='application/vnd.openxmlformats-officedocument.wordprocessingml.document'"
         
         if folder_id:
-            query += f" and '{folder_id}' in parents"
+            query += f" and '{_escape_query_value(folder_id)}' in parents"
             
-        results = self.service.files().list(
-            q=query,
-            pageSize=page_size,
-            fields="nextPageToken, files(id, name, createdTime, modifiedTime, size)"
-        ).execute()
-        
-        return results.get('files', [])
+        return list(self._iter_files(query, page_size))
     
-    def download_file(self, file_id: str, output_path: Optional[str] = None) -> str:
+    def download_file(self, file_id: str, output_path: Optional[str] = None, unique_name: bool = False) -> str:
         """
         Lädt eine Datei aus Google Drive herunter.
         
         Args:
             file_id: ID der Datei
             output_path: Pfad, unter dem die Datei gespeichert werden soll (optional)
+            unique_name: Ohne output_path unter downloads/<id>_<name> statt
+                downloads/<name> speichern (für parallele Downloads)
             
         Returns:
             Pfad zur heruntergeladenen Datei
         """
-        file_metadata = self.service.files().get(fileId=file_id, fields="name").execute()
+        service = self.service
+        file_metadata = service.files().get(fileId=file_id, fields="name").execute()
         file_name = file_metadata.get('name', f'document_{file_id}.docx')
         
         if not output_path:
+            if unique_name:
+                file_name = f"{file_id}_{file_name}"
             output_path = os.path.join('downloads', file_name)
         
         # Sicherstellen, dass das Verzeichnis existiert
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        request = self.service.files().get_media(fileId=file_id)
+        request = service.files().get_media(fileId=file_id)
         
-        with open(output_path, 'wb') as f:
-            downloader = MediaIoBaseDownload(f, request)
+        with open(output_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            downloader = MediaIoBaseDownload(f, request, chunksize=DOWNLOAD_CHUNK_SIZE)
             done = False
             while not done:
                 status, done = downloader.next_chunk()
         
         return output_path
     
+    def iter_downloads(self, file_ids: Iterable[str], max_workers: int = 8) -> Iterator[Tuple[str, Future]]:
+        """
+        Lädt mehrere Dateien parallel herunter und liefert sie, sobald sie fertig sind.
+        
+        Jede Datei wird unter downloads/<id>_<name> gespeichert, damit sich
+        gleichnamige Dateien nicht gegenseitig überschreiben. Jeder Thread nutzt
+        einen eigenen Drive-Service (siehe _get_drive_service).
+        
+        Args:
+            file_ids: IDs der Dateien
+            max_workers: Anzahl paralleler Downloads
+            
+        Yields:
+            Tupel aus Datei-ID und abgeschlossenem Future (Pfad oder Fehler)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download_file, file_id, unique_name=True): file_id
+                for file_id in file_ids
+            }
+            for future in as_completed(futures):
+                yield futures[future], future
+    
+    def download_files(self, file_ids: List[str], max_workers: int = 8) -> List[str]:
+        """
+        Lädt mehrere Dateien parallel aus Google Drive herunter.
+        
+        Args:
+            file_ids: IDs der Dateien
+            max_workers: Anzahl paralleler Downloads
+            
+        Returns:
+            Pfade zu den heruntergeladenen Dateien (downloads/<id>_<name>) in der
+            Reihenfolge der IDs
+        """
+        paths = {
+            file_id: future.result()
+            for file_id, future in self.iter_downloads(file_ids, max_workers)
+        }
+        return [paths[file_id] for file_id in file_ids]
+    
     def search_docx_files(self, query_string: str, page_size: int = 100) -> List[Dict[str, Any]]:
         """
         Sucht nach DOCX-Dateien, die dem Suchbegriff entsprechen.
@@ -126,14 +287,11 @@ class GoogleDriveClient:
             page_size: Anzahl der Ergebnisse pro Seite
             
         Returns:
-            Liste von DOCX-Dateien mit Metadaten
+            Liste aller DOCX-Dateien (id, name) über alle Ergebnisseiten
         """
-        query = f"mimeType='application/vnd.openxmlformats-officedocument.wordprocessingml.document' and fullText contains '{query_string}'"
-        
-        results = self.service.files().list(
-            q=query,
-            pageSize=page_size,
-            fields="nextPageToken, files(id, name, createdTime, modifiedTime, size)"
-        ).execute()
+        query = (
+            "mimeType='application/vnd.openxmlformats-officedocument.wordprocessingml.document'"
+            f" and fullText contains '{_escape_query_value(query_string)}'"
+        )
         
-        return results.get('files', [])
\ No newline at end of file
+        return list(self._iter_files(query, page_size))
\ No newline at end of file
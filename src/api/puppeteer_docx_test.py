@@ -2,10 +2,10 @@ import os
 import json
 import logging
 import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from api.docx_processor import DocxProcessor
-from core.seo_analyzer import SEOAnalyzer
+from src.api.docx_processor import DocxProcessor
+from src.core.seo_analyzer import SEOAnalyzer, AnalyzedText
 
 def run_autonomous_docx_test(documents_dir: str):
     """
@@ -29,9 +29,10 @@ def run_autonomous_docx_test(documents_dir: str):
         }
         
         for doc in documents:
-            # SEO-Analyse durchführen
-            seo_metrics = SEOAnalyzer.semantic_analysis(doc['text'])
-            readability = SEOAnalyzer.readability_metrics(doc['text'])
+            # SEO-Analyse auf einmalig tokenisiertem Text durchführen
+            analyzed = AnalyzedText.from_text(doc['text'])
+            seo_metrics = SEOAnalyzer.semantic_analysis(analyzed)
+            readability = SEOAnalyzer.readability_metrics(analyzed)
             
             doc_report = {
                 'filename': doc['filename'],
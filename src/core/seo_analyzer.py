@@ -5,111 +5,402 @@ Erweiterte Metriken für Textagenturen und SEO-Optimierung.
 import os
 import re
 import math
+import heapq
+import hashlib
 import logging
-from typing import Dict, List, Any
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Dict, Iterable, List, Any, Optional, Union
 
-# NLTK-Konfiguration mit erweitertem Fallback-Mechanismus
-import nltk
+from .tokenizer import TOKEN_RE, tokenize
 
-# Definiere einen benutzerdefinierten NLTK-Datenordner
-nltk_data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'nltk_data')
-os.makedirs(nltk_data_path, exist_ok=True)
+# Mitgelieferte NLTK-Daten unter src/nltk_data (nur die deutschen Stopwords,
+# daher nicht in nltk.data.path, sondern direkt gelesen)
+vendored_nltk_data_path = os.path.join(os.path.dirname(__file__), '..', 'nltk_data')
+_VENDORED_STOPWORDS = {
+    'german': os.path.join(vendored_nltk_data_path, 'corpora', 'stopwords', 'german')
+}
 
-# Setze den NLTK-Datenordner
-nltk.data.path.append(nltk_data_path)
+# Definiere einen benutzerdefinierten NLTK-Datenordner für Nachladungen
+nltk_data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'nltk_data')
 
 # Logging-Konfiguration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def download_nltk_resources(language: str = 'german'):
+# Datenpfade der NLTK-Ressourcen (für nltk.data.find, Stopwords je Sprache)
+_NLTK_RESOURCE_PATHS = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords/{language}',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger'
+}
+
+def download_nltk_resources(language: str = 'german', resources: Optional[Iterable[str]] = None):
     """
     Lädt NLTK-Ressourcen sicher herunter mit Fallback-Mechanismus.
     
+    Bereits vorhandene Ressourcen werden übersprungen, ohne das Netzwerk zu
+    kontaktieren. Stopwords gelten nur als vorhanden, wenn die Datei der
+    angefragten Sprache existiert.
+    
     Args:
         language: Sprache für Ressourcen (default: deutsch)
+        resources: Nur diese Ressourcen bereitstellen (default: alle der Sprache)
     """
-    resources = {
-        'german': ['punkt', 'stopwords'],
-        'english': ['punkt', 'stopwords', 'averaged_perceptron_tagger']
+    import nltk
+    
+    language_resources = {
+        'german': ['punkt', 'punkt_tab', 'stopwords'],
+        'english': ['punkt', 'punkt_tab', 'stopwords', 'averaged_perceptron_tagger']
     }
+    if resources is None:
+        resources = language_resources.get(language, language_resources['german'])
     
     try:
-        for resource in resources.get(language, resources['german']):
+        for resource in resources:
+            try:
+                nltk.data.find(_NLTK_RESOURCE_PATHS[resource].format(language=language))
+                continue
+            except LookupError:
+                pass
+            
             try:
+                os.makedirs(nltk_data_path, exist_ok=True)
                 nltk.download(resource, download_dir=nltk_data_path, quiet=True)
             except Exception as e:
                 logger.warning(f"Fehler beim Download von {resource}: {e}")
     except Exception as e:
         logger.error(f"Unerwarteter Fehler bei NLTK-Ressourcen-Download: {e}")
 
-# Sichere NLTK-Ressourcen-Downloads
-download_nltk_resources()
+@lru_cache(maxsize=None)
+def _nltk(*resources: str, language: str = 'german'):
+    """
+    Importiert NLTK beim ersten Gebrauch und stellt die benötigten Ressourcen einmalig bereit.
+    
+    Args:
+        resources: Benötigte Ressourcen (z. B. 'stopwords'), nur diese werden nachgeladen
+        language: Sprache sprachabhängiger Ressourcen (Stopwords)
+    
+    Returns:
+        Das nltk-Modul
+    """
+    # NLTK-Konfiguration mit erweitertem Fallback-Mechanismus
+    import nltk
+    
+    # Download-Verzeichnis nach den Standardpfaden durchsuchen
+    if nltk_data_path not in nltk.data.path:
+        nltk.data.path.append(nltk_data_path)
+    
+    # Nur fehlende der angefragten Ressourcen nachladen
+    download_nltk_resources(language=language, resources=resources)
+    return nltk
+
+# Ab dieser Dokumentanzahl wird TF-IDF vektorisiert mit NumPy berechnet
+_VECTORIZED_MIN_DOCS = 50
+
+# Ab dieser Tokenanzahl lohnt sich der Numba-Kernel gegenüber reinem Python
+_NUMBA_MIN_TOKENS = 200_000
+
+@lru_cache(maxsize=1)
+def _get_tfidf_kernel():
+    """
+    Kompiliert den optionalen Numba-Kernel für TF-IDF beim ersten Gebrauch.
+    
+    Returns:
+        JIT-kompilierte Kernel-Funktion oder None, falls numba fehlt
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    @njit(cache=True)
+    def _tfidf_kernel(ids, counts, doc_starts, idfs, out):
+        """
+        Akkumuliert das TF-IDF-Maximum je Term über alle Dokumente (CSR-Layout).
+        """
+        for doc in range(doc_starts.shape[0] - 1):
+            start = doc_starts[doc]
+            end = doc_starts[doc + 1]
+            doc_length = 0
+            for i in range(start, end):
+                doc_length += counts[i]
+            for i in range(start, end):
+                score = counts[i] / doc_length * idfs[ids[i]]
+                if score > out[ids[i]]:
+                    out[ids[i]] = score
+    
+    return _tfidf_kernel
+
+def _text_cache(maxsize: int):
+    """
+    LRU-Cache für Funktionen eines Textes, mit einem Digest des Textes als Schlüssel.
+    
+    Anders als lru_cache hält der Cache nur 16-Byte-Digests und die
+    abgeleiteten Ergebnisse, nicht die vollständigen Dokumente.
+    
+    Args:
+        maxsize: Maximale Anzahl gemerkter Ergebnisse
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(text: str, *args):
+            key = (hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), args)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+            
+            result = func(text, *args)
+            with lock:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+@_text_cache(maxsize=256)
+def _term_counts(text: str) -> Counter:
+    """
+    Zählt die Terme eines Dokuments und merkt sich das Ergebnis.
+    
+    Wiederholte Analysen desselben Textes (z. B. Streamlit-Reruns) werden so
+    zu einem Cache-Treffer statt einer erneuten Tokenisierung.
+    
+    Args:
+        text: Textdokument
+    
+    Returns:
+        Termfrequenzen des Dokuments (nicht verändern, da geteilt)
+    """
+    return Counter(tokenize(text))
+
+@_text_cache(maxsize=256)
+def _word_tokenize(text_lower: str, language: str) -> tuple:
+    """
+    Tokenisiert einen kleingeschriebenen Text mit NLTK und merkt sich das Ergebnis.
+    
+    Args:
+        text_lower: Kleingeschriebener Text
+        language: Sprache für Tokenisierung
+    
+    Returns:
+        Alphanumerische Tokens als Tupel (unveränderlich, da geteilt)
+    """
+    tokens = _nltk('punkt', 'punkt_tab').word_tokenize(text_lower, language=language)
+    return tuple(token for token in tokens if token.isalnum())
 
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from textstat import flesch_reading_ease, flesch_kincaid_grade
+# Fallback-Stopwords, falls das NLTK-Korpus nicht verfügbar ist
+_FALLBACK_STOPWORDS = frozenset({'der', 'die', 'das', 'und', 'oder', 'in', 'zu', 'ein', 'eine'})
+
+@lru_cache(maxsize=None)
+def _load_stopwords(language: str) -> frozenset:
+    """
+    Lädt die Stopwords einer Sprache einmalig pro Prozess.
+    
+    Deutsch wird direkt aus der mitgelieferten Datei gelesen, andere Sprachen
+    aus der NLTK-Datei corpora/stopwords/<language> (bei Bedarf nachgeladen).
+    
+    Args:
+        language: Sprache der Stopwords
+    
+    Returns:
+        Menge der Stopwords (Fallback-Stopwords bei Fehlern)
+    """
+    try:
+        vendored_path = _VENDORED_STOPWORDS.get(language)
+        if vendored_path and os.path.exists(vendored_path):
+            with open(vendored_path, encoding='utf-8') as stream:
+                return frozenset(stream.read().split())
+        
+        nltk = _nltk('stopwords', language=language)
+        with nltk.data.find(f'corpora/stopwords/{language}').open(encoding='utf-8') as stream:
+            return frozenset(stream.read().split())
+    except Exception as e:
+        logger.warning(f"Stopwords-Fehler für {language}: {e}")
+        return _FALLBACK_STOPWORDS
+
+# Satzenden und Silben (Vokalgruppen) für die Lesbarkeitsformeln
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_SYLLABLE_RE = re.compile(r'[aeiouäöüy]+')
+
+@dataclass
+class AnalyzedText:
+    """
+    Einmalig tokenisierter Text, der von allen Metriken gemeinsam genutzt wird.
+    """
+    lower: List[str]
+    counts: Counter
+    n_sent: int
+    n_syl: int
+
+    @classmethod
+    def from_text(cls, text: str) -> 'AnalyzedText':
+        """
+        Tokenisiert den Text und ermittelt Satz- und Silbenanzahl.
+        
+        Args:
+            text: Vollständiger Text
+        
+        Returns:
+            Vorverarbeiteter Text
+        """
+        # Einmal kleinschreiben und in C tokenisieren statt pro Token .lower() aufzurufen
+        text_lower = text.lower()
+        lower = TOKEN_RE.findall(text_lower)
+        sentences = [part for part in _SENTENCE_SPLIT_RE.split(text) if part.strip()]
+        
+        return cls(
+            lower=lower,
+            counts=Counter(lower),
+            n_sent=len(sentences),
+            n_syl=len(_SYLLABLE_RE.findall(text_lower))
+        )
+
+@_text_cache(maxsize=256)
+def _analyze_text(text: str) -> AnalyzedText:
+    """
+    Analysiert einen Rohtext und merkt sich das Ergebnis.
+    
+    Lesbarkeit, Keyword-Dichte und semantische Analyse desselben Textes
+    (z. B. bei Streamlit-Reruns) teilen sich so eine Tokenisierung.
+    
+    Args:
+        text: Vollständiger Text
+    
+    Returns:
+        Vorverarbeiteter Text (nicht verändern, da geteilt)
+    """
+    return AnalyzedText.from_text(text)
+
+@dataclass
+class PreparedCorpus:
+    """
+    Einmalig gezählter Korpus, den TF-IDF und WDF-IDF gemeinsam nutzen.
+    """
+    term_counts: List[Counter]
+    idf: Dict[str, float]
+    total_docs: int
+
+    @classmethod
+    def from_documents(cls, documents: List[str]) -> 'PreparedCorpus':
+        """
+        Zählt die Terme eindeutiger Dokumente und berechnet die IDF je Term.
+        
+        Identische Dokumente werden nur einmal verarbeitet, ihre Häufigkeit
+        fließt in die Dokumentenfrequenz ein. Die Reihenfolge folgt dem letzten
+        Vorkommen, da bei WDF-IDF spätere Dokumente Werte überschreiben.
+        
+        Args:
+            documents: Liste von Textdokumenten
+        
+        Returns:
+            Vorbereiteter Korpus
+        """
+        last_position = {doc: position for position, doc in enumerate(documents)}
+        unique_docs = sorted(last_position, key=last_position.get)
+        multiplicities = Counter(documents)
+        term_counts = [_term_counts(doc) for doc in unique_docs]
+        
+        # Dokumentenfrequenz in einem Durchlauf über alle Dokumente
+        document_frequency = Counter()
+        for doc, counts in zip(unique_docs, term_counts):
+            if multiplicities[doc] == 1:
+                document_frequency.update(counts.keys())
+            else:
+                document_frequency.update(dict.fromkeys(counts, multiplicities[doc]))
+        
+        # IDF einmal pro Term vorberechnen
+        total_docs = len(documents)
+        idf = {
+            term: math.log(total_docs / (df + 1))
+            for term, df in document_frequency.items()
+        }
+        
+        return cls(term_counts=term_counts, idf=idf, total_docs=total_docs)
 
 class SEOAnalyzer:
     @staticmethod
-    def safe_tokenize(text: str, language: str = 'german') -> List[str]:
+    def safe_tokenize(text: str, language: str = 'german', linguistic: bool = False) -> List[str]:
         """
         Sichere Tokenisierung mit mehreren Fallback-Mechanismen.
         
+        Standardmäßig wird der vorkompilierte Regex-Tokenizer verwendet (ein
+        Durchlauf in C); NLTK (Punkt + Treebank) nur auf ausdrücklichen Wunsch.
+        
         Args:
             text: Eingabetext
             language: Sprache für Tokenisierung
+            linguistic: Linguistische Tokenisierung mit NLTK verwenden
         
         Returns:
             Liste von Tokens
         """
-        try:
-            # NLTK-Tokenisierung
-            tokens = word_tokenize(text.lower(), language=language)
-            return [token for token in tokens if token.isalnum()]
-        except Exception as e:
-            logger.warning(f"NLTK-Tokenisierung fehlgeschlagen: {e}")
-            
+        text_lower = text.lower()
+        if linguistic:
             try:
-                # Reguläre Ausdrücke als Fallback
-                tokens = re.findall(r'\b\w+\b', text.lower())
-                return tokens
-            except Exception as fallback_error:
-                logger.error(f"Fallback-Tokenisierung fehlgeschlagen: {fallback_error}")
-                return text.lower().split()
+                # NLTK-Tokenisierung (gecacht je Text und Sprache)
+                return list(_word_tokenize(text_lower, language))
+            except Exception as e:
+                logger.warning(f"NLTK-Tokenisierung fehlgeschlagen: {e}")
+        
+        try:
+            # Vorkompilierter regulärer Ausdruck (gleiche Tokens wie WordCounter)
+            return TOKEN_RE.findall(text_lower)
+        except Exception as fallback_error:
+            logger.error(f"Fallback-Tokenisierung fehlgeschlagen: {fallback_error}")
+            return text_lower.split()
 
     @staticmethod
-    def get_stopwords(language: str = 'german') -> set:
+    def get_stopwords(language: str = 'german') -> frozenset:
         """
-        Holt Stopwords für eine Sprache.
+        Holt Stopwords für eine Sprache (pro Sprache einmalig geladen).
         
         Args:
             language: Sprache der Stopwords
         
         Returns:
-            Menge von Stopwords
+            Unveränderliche Menge von Stopwords
         """
-        try:
-            return set(stopwords.words(language))
-        except Exception as e:
-            logger.warning(f"Stopwords-Fehler für {language}: {e}")
-            # Fallback-Stopwords
-            return {'der', 'die', 'das', 'und', 'oder', 'in', 'zu', 'ein', 'eine'}
+        return _load_stopwords(language)
 
     @staticmethod
-    def readability_metrics(text: str) -> Dict[str, Any]:
+    def readability_metrics(text: Union[str, AnalyzedText]) -> Dict[str, Any]:
         """
         Berechnet Lesbarkeitsmetriken.
         
+        Die Flesch-Formeln werden direkt aus Wort-, Satz- und Silbenanzahl
+        berechnet, statt den Text pro Metrik erneut durch textstat zu schicken.
+        
         Args:
-            text: Vollständiger Text
+            text: Vollständiger Text oder bereits analysierter Text
         
         Returns:
             Lesbarkeitsmetriken
         """
         try:
-            flesch_ease = flesch_reading_ease(text)
-            flesch_grade = flesch_kincaid_grade(text)
+            analyzed = SEOAnalyzer._as_analyzed(text)
+            n_words = len(analyzed.lower)
+            if n_words == 0 or analyzed.n_sent == 0:
+                raise ValueError("Text enthält keine Wörter oder Sätze")
+            
+            words_per_sentence = n_words / analyzed.n_sent
+            syllables_per_word = analyzed.n_syl / n_words
+            flesch_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+            flesch_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
             
             return {
                 'flesch_reading_ease': flesch_ease,
@@ -147,99 +438,340 @@ class SEOAnalyzer:
             return "Leicht verständlich"
 
     @staticmethod
-    def calculate_tf_idf(documents: List[str]) -> Dict[str, float]:
+    def calculate_tf_idf(documents: Union[List[str], PreparedCorpus], top_k: Optional[int] = None) -> Dict[str, float]:
         """
         Berechnet TF-IDF für alle Dokumente.
         
         Args:
-            documents: Liste von Textdokumenten
+            documents: Liste von Textdokumenten oder bereits vorbereiteter Korpus
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
         
         Returns:
             TF-IDF Werte für Wörter
         """
-        # Tokenisierung und Vorverarbeitung
-        def preprocess(text):
-            tokens = SEOAnalyzer.safe_tokenize(text)
-            return [token for token in tokens if token.isalnum()]
+        # Große Korpora aus Rohtexten vektorisiert berechnen
+        if not isinstance(documents, PreparedCorpus) and len(documents) >= _VECTORIZED_MIN_DOCS:
+            return SEOAnalyzer.calculate_tf_idf_batch(documents, top_k)
+        
+        corpus = SEOAnalyzer.prepare(documents)
+        term_counts, idf = corpus.term_counts, corpus.idf
+        
+        # TF-IDF Berechnung (Maximum über alle Dokumente je Term)
+        total_tokens = sum(sum(counts.values()) for counts in term_counts)
+        kernel = _get_tfidf_kernel() if total_tokens >= _NUMBA_MIN_TOKENS else None
+        if kernel is not None:
+            tf_idf_results = SEOAnalyzer._tf_idf_numba(term_counts, idf, kernel)
+        else:
+            tf_idf_results = {}
+            
+            for counts in term_counts:
+                if not counts:
+                    continue
+                # Kehrwert der Dokumentlänge einmal pro Dokument statt Division pro Term
+                inverse_length = 1.0 / sum(counts.values())
+                for term, count in counts.items():
+                    score = count * inverse_length * idf[term]
+                    if score > tf_idf_results.get(term, -math.inf):
+                        tf_idf_results[term] = score
+        
+        return SEOAnalyzer._rank(tf_idf_results, top_k)
+
+    @staticmethod
+    def prepare(documents: Union[List[str], PreparedCorpus]) -> PreparedCorpus:
+        """
+        Bereitet einen Korpus einmalig für mehrere Metriken vor.
+        
+        Args:
+            documents: Liste von Textdokumenten oder bereits vorbereiteter Korpus
+        
+        Returns:
+            Vorbereiteter Korpus
+        """
+        return documents if isinstance(documents, PreparedCorpus) else PreparedCorpus.from_documents(documents)
+
+    @staticmethod
+    def _rank(scores: Dict[str, float], top_k: Optional[int] = None) -> Dict[str, float]:
+        """
+        Sortiert Termwerte absteigend, bei top_k per Heap statt Vollsortierung.
+        
+        Gleichstände werden alphabetisch nach Term aufgelöst, damit die
+        Reihenfolge nicht von der Dokumentreihenfolge abhängt.
+        
+        Args:
+            scores: Werte je Term
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
+        
+        Returns:
+            Absteigend sortierte Werte je Term
+        """
+        def rank_key(item):
+            return -item[1], item[0]
         
-        # Vorverarbeitung der Dokumente
-        processed_docs = [preprocess(doc) for doc in documents]
+        if top_k is not None:
+            return dict(heapq.nsmallest(top_k, scores.items(), key=rank_key))
+        return dict(sorted(scores.items(), key=rank_key))
+
+    @staticmethod
+    def _rank_array(terms: List[str], scores, top_k: Optional[int] = None) -> Dict[str, float]:
+        """
+        Sortiert Termwerte aus einem NumPy-Array absteigend, ohne Python-Sortierung.
         
-        # Wortfrequenz im Dokument
-        def term_frequency(doc, term):
-            return doc.count(term) / len(doc)
+        Bei top_k wird der Schwellwert per np.partition in O(V) bestimmt und nur
+        die Kandidaten werden sortiert. Gleichstände werden wie bei _rank
+        alphabetisch nach Term aufgelöst.
         
-        # Dokumentenfrequenz
-        def document_frequency(term):
-            return sum(1 for doc in processed_docs if term in doc)
+        Args:
+            terms: Terme in Reihenfolge der Array-Indizes
+            scores: Werte je Term als NumPy-Array
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
         
-        # TF-IDF Berechnung
-        tf_idf_results = {}
-        total_docs = len(processed_docs)
+        Returns:
+            Absteigend sortierte Werte je Term
+        """
+        import numpy as np
         
-        for doc in processed_docs:
-            for term in set(doc):
-                tf = term_frequency(doc, term)
-                idf = math.log(total_docs / (document_frequency(term) + 1))
-                tf_idf_results[term] = tf * idf
+        if top_k is not None and top_k <= 0:
+            return {}
+        if top_k is not None and top_k < len(scores):
+            kth = len(scores) - top_k
+            threshold = np.partition(scores, kth)[kth]
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(scores))
         
-        return dict(sorted(tf_idf_results.items(), key=lambda x: x[1], reverse=True))
+        # Primär nach Wert absteigend, bei Gleichstand nach Term (letzter Schlüssel zuerst)
+        candidate_terms = np.array([terms[index] for index in candidates.tolist()], dtype=str)
+        order = candidates[np.lexsort((candidate_terms, -scores[candidates]))][:top_k]
+        return dict(zip([terms[index] for index in order.tolist()], scores[order].tolist()))
 
     @staticmethod
-    def calculate_wdf_idf(documents: List[str]) -> Dict[str, float]:
+    def calculate_tf_idf_batch(documents: List[str], top_k: Optional[int] = None) -> Dict[str, float]:
         """
-        Berechnet WDF-IDF (Within Document Frequency - Inverse Document Frequency) für Dokumente.
+        Berechnet TF-IDF vektorisiert mit NumPy über eine CSR-Termmatrix.
+        
+        Liefert dieselben Werte wie calculate_tf_idf, lohnt sich aber erst ab
+        vielen Dokumenten, da die Arrays einmalig aufgebaut werden müssen.
         
         Args:
             documents: Liste von Textdokumenten
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
         
         Returns:
-            WDF-IDF Werte für Wörter
+            TF-IDF Werte für Wörter (Maximum über alle Dokumente)
+        """
+        import numpy as np
+        
+        vocabulary, ids, counts, doc_starts = SEOAnalyzer._build_term_matrix(documents)
+        if not vocabulary:
+            return {}
+        
+        entries_per_doc = np.diff(doc_starts)
+        non_empty = entries_per_doc > 0
+        
+        # TF = Anzahl / Dokumentlänge, DF = Anzahl Dokumente je Term
+        doc_lengths = np.add.reduceat(counts, doc_starts[:-1][non_empty])
+        tf = counts / np.repeat(doc_lengths, entries_per_doc[non_empty])
+        df = np.bincount(ids, minlength=len(vocabulary))
+        idf = np.log(len(documents) / (df + 1))
+        
+        # Maximum je Term nur über Dokumente, die den Term enthalten
+        scores = np.full(len(vocabulary), -np.inf)
+        np.maximum.at(scores, ids, tf * idf[ids])
+        
+        return SEOAnalyzer._rank_array(list(vocabulary), scores, top_k)
+
+    @staticmethod
+    def _build_term_matrix(documents: List[str]):
+        """
+        Baut die Term-Dokument-Matrix im CSR-Layout in einem Durchlauf auf.
+        
+        Args:
+            documents: Liste von Textdokumenten
+        
+        Returns:
+            Tupel aus Vokabular (Term -> ID), Term-IDs, Anzahlen und Zeilenanfängen
+        """
+        import numpy as np
+        
+        vocabulary = {}
+        term_ids = []
+        term_counts = []
+        doc_starts = [0]
+        for doc in documents:
+            for term, count in _term_counts(doc).items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                term_counts.append(count)
+            doc_starts.append(len(term_ids))
+        
+        return (
+            vocabulary,
+            np.asarray(term_ids, dtype=np.int64),
+            np.asarray(term_counts, dtype=np.float64),
+            np.asarray(doc_starts, dtype=np.int64)
+        )
+
+    @staticmethod
+    def _tf_idf_numba(term_counts: List[Counter], idf: Dict[str, float], kernel) -> Dict[str, float]:
+        """
+        Berechnet TF-IDF mit dem Numba-Kernel auf internierten Term-IDs.
+        
+        Args:
+            term_counts: Termfrequenzen pro Dokument
+            idf: Vorberechnete IDF-Werte je Term
+            kernel: Kompilierter Numba-Kernel
+        
+        Returns:
+            TF-IDF Werte für Wörter (Maximum über alle Dokumente)
         """
-        # Tokenisierung und Vorverarbeitung
-        def preprocess(text):
-            tokens = SEOAnalyzer.safe_tokenize(text)
-            return [token for token in tokens if token.isalnum()]
+        import numpy as np
         
-        # Vorverarbeitung der Dokumente
-        processed_docs = [preprocess(doc) for doc in documents]
+        # Terme auf dichte Integer-IDs abbilden
+        vocabulary = {term: index for index, term in enumerate(idf)}
+        total_entries = sum(len(counts) for counts in term_counts)
         
-        # Within Document Frequency (WDF) - logarithmische Skalierung
-        def within_document_frequency(doc, term):
-            term_count = doc.count(term)
-            return math.log(1 + term_count) if term_count > 0 else 0
+        ids = np.fromiter(
+            (vocabulary[term] for counts in term_counts for term in counts),
+            dtype=np.int32, count=total_entries
+        )
+        counts_array = np.fromiter(
+            (count for counts in term_counts for count in counts.values()),
+            dtype=np.int32, count=total_entries
+        )
+        doc_starts = np.zeros(len(term_counts) + 1, dtype=np.int32)
+        np.cumsum([len(counts) for counts in term_counts], out=doc_starts[1:])
+        idfs = np.fromiter(idf.values(), dtype=np.float64, count=len(idf))
         
-        # Dokumentenfrequenz
-        def document_frequency(term):
-            return sum(1 for doc in processed_docs if term in doc)
+        out = np.full(len(vocabulary), -np.inf)
+        kernel(ids, counts_array, doc_starts, idfs, out)
         
-        # WDF-IDF Berechnung
+        return dict(zip(vocabulary, out.tolist()))
+
+    @staticmethod
+    def calculate_wdf_idf(documents: Union[List[str], PreparedCorpus], top_k: Optional[int] = None) -> Dict[str, float]:
+        """
+        Berechnet WDF-IDF (Within Document Frequency - Inverse Document Frequency) für Dokumente.
+        
+        Args:
+            documents: Liste von Textdokumenten oder bereits vorbereiteter Korpus
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
+        
+        Returns:
+            WDF-IDF Werte für Wörter
+        """
+        # Große Korpora aus Rohtexten vektorisiert berechnen
+        if not isinstance(documents, PreparedCorpus) and len(documents) >= _VECTORIZED_MIN_DOCS:
+            return SEOAnalyzer.calculate_wdf_idf_batch(documents, top_k)
+        
+        corpus = SEOAnalyzer.prepare(documents)
+        term_counts, idf = corpus.term_counts, corpus.idf
+        
+        # WDF-IDF Berechnung mit logarithmisch skalierter WDF
         wdf_idf_results = {}
-        total_docs = len(processed_docs)
         
-        for doc in processed_docs:
-            for term in set(doc):
-                wdf = within_document_frequency(doc, term)
-                idf = math.log(total_docs / (document_frequency(term) + 1))
-                wdf_idf_results[term] = wdf * idf
+        for counts in term_counts:
+            for term, count in counts.items():
+                wdf_idf_results[term] = math.log(1 + count) * idf[term]
+        
+        return SEOAnalyzer._rank(wdf_idf_results, top_k)
+
+    @staticmethod
+    def calculate_wdf_idf_streaming(documents: Iterable[str], top_k: Optional[int] = None) -> Dict[str, float]:
+        """
+        Berechnet WDF-IDF in einem Durchlauf über beliebig viele Dokumente.
+        
+        Es werden nur Dokumentenfrequenz und die Termanzahl des jeweils letzten
+        Dokuments je Term gehalten, der Speicherbedarf wächst also mit dem
+        Vokabular statt mit dem Korpus. Dokumente werden nicht zwischengespeichert.
         
-        return dict(sorted(wdf_idf_results.items(), key=lambda x: x[1], reverse=True))
+        Args:
+            documents: Iterable von Textdokumenten (z. B. ein Generator)
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
+        
+        Returns:
+            WDF-IDF Werte für Wörter (gleiche Werte wie calculate_wdf_idf)
+        """
+        document_frequency = Counter()
+        last_counts = {}
+        total_docs = 0
+        
+        for doc in documents:
+            counts = Counter(tokenize(doc))
+            document_frequency.update(counts.keys())
+            # Spätere Dokumente überschreiben den Wert wie in calculate_wdf_idf
+            last_counts.update(counts)
+            total_docs += 1
+        
+        wdf_idf_results = {
+            term: math.log(1 + count) * math.log(total_docs / (document_frequency[term] + 1))
+            for term, count in last_counts.items()
+        }
+        return SEOAnalyzer._rank(wdf_idf_results, top_k)
 
     @staticmethod
-    def keyword_density(text: str, keywords: List[str]) -> Dict[str, float]:
+    def calculate_wdf_idf_batch(documents: List[str], top_k: Optional[int] = None) -> Dict[str, float]:
+        """
+        Berechnet WDF-IDF vektorisiert mit NumPy über eine CSR-Termmatrix.
+        
+        Liefert dieselben Werte wie calculate_wdf_idf (je Term der Wert aus dem
+        letzten Dokument, das ihn enthält).
+        
+        Args:
+            documents: Liste von Textdokumenten
+            top_k: Nur die top_k höchsten Werte liefern (default: alle)
+        
+        Returns:
+            WDF-IDF Werte für Wörter
+        """
+        import numpy as np
+        
+        vocabulary, ids, counts, _ = SEOAnalyzer._build_term_matrix(documents)
+        if not vocabulary:
+            return {}
+        
+        df = np.bincount(ids, minlength=len(vocabulary))
+        idf = np.log(len(documents) / (df + 1))
+        scores = np.log1p(counts) * idf[ids]
+        
+        # Letztes Vorkommen je Term bestimmen (Einträge liegen in Dokumentreihenfolge)
+        last_entry = np.zeros(len(vocabulary), dtype=np.int64)
+        np.maximum.at(last_entry, ids, np.arange(len(ids)))
+        
+        return SEOAnalyzer._rank_array(list(vocabulary), scores[last_entry], top_k)
+
+    @staticmethod
+    def _as_analyzed(text: Union[str, AnalyzedText]) -> AnalyzedText:
+        """
+        Liefert einen bereits analysierten Text oder tokenisiert den Rohtext (gecacht).
+        """
+        return text if isinstance(text, AnalyzedText) else _analyze_text(text)
+
+    @staticmethod
+    def keyword_density(text: Union[str, AnalyzedText], keywords: List[str]) -> Dict[str, float]:
         """
         Berechnet die Keyword-Dichte für gegebene Keywords.
         
         Args:
-            text: Vollständiger Text
+            text: Vollständiger Text oder bereits analysierter Text
             keywords: Liste von Keywords
         
         Returns:
             Keyword-Dichte pro Keyword
         """
-        tokens = SEOAnalyzer.safe_tokenize(text)
-        total_words = len(tokens)
-        keyword_counts = {keyword: text.lower().count(keyword.lower()) for keyword in keywords}
+        analyzed = SEOAnalyzer._as_analyzed(text)
+        total_words = len(analyzed.lower)
+        keyword_counts = {}
+        # N-Gramm-Zählungen je Keyword-Länge, jeweils mit einem Durchlauf über die Tokens
+        ngram_counts = {1: analyzed.counts}
+        for keyword in keywords:
+            keyword_tokens = tuple(tokenize(keyword))
+            n = len(keyword_tokens)
+            if n == 0:
+                keyword_counts[keyword] = 0
+                continue
+            if n not in ngram_counts:
+                ngram_counts[n] = Counter(zip(*(analyzed.lower[i:] for i in range(n))))
+            # Einzelwörter als String, Mehrwort-Keywords als Token-Tupel nachschlagen
+            keyword_counts[keyword] = ngram_counts[n][keyword_tokens[0] if n == 1 else keyword_tokens]
         
         return {
             keyword: (count / total_words) * 100 
@@ -247,12 +779,12 @@ class SEOAnalyzer:
         }
 
     @staticmethod
-    def semantic_analysis(text: str, language: str = 'german') -> Dict[str, Any]:
+    def semantic_analysis(text: Union[str, AnalyzedText], language: str = 'german') -> Dict[str, Any]:
         """
         Führt eine einfache semantische Analyse durch.
         
         Args:
-            text: Vollständiger Text
+            text: Vollständiger Text oder bereits analysierter Text
             language: Sprache für Analyse
         
         Returns:
@@ -260,17 +792,41 @@ class SEOAnalyzer:
         """
         try:
             # Stopwords entfernen
-            stop_words = SEOAnalyzer.get_stopwords(language)
-            tokens = SEOAnalyzer.safe_tokenize(text, language)
-            meaningful_words = [word for word in tokens if word.isalnum() and word not in stop_words]
+            stop_words = _load_stopwords(language)
+            analyzed = SEOAnalyzer._as_analyzed(text)
+            # Vorhandene Tokenzählung filtern statt eine Wortliste neu zu zählen
+            meaningful_counts = Counter({
+                word: count for word, count in analyzed.counts.items() if word not in stop_words
+            })
             
             return {
-                'unique_meaningful_words': len(set(meaningful_words)),
-                'top_meaningful_words': nltk.FreqDist(meaningful_words).most_common(10)
+                'unique_meaningful_words': len(meaningful_counts),
+                'top_meaningful_words': meaningful_counts.most_common(10)
             }
         except Exception as e:
             logger.warning(f"Semantische Analyse-Fehler: {e}")
             return {
                 'unique_meaningful_words': 0,
                 'top_meaningful_words': []
-            }
\ No newline at end of file
+            }
+
+    @staticmethod
+    def analyze_all(text: str, keywords: Optional[List[str]] = None, language: str = 'german') -> Dict[str, Any]:
+        """
+        Berechnet alle Textmetriken auf Basis einer einzigen Tokenisierung.
+        
+        Args:
+            text: Vollständiger Text
+            keywords: Liste von Keywords für die Keyword-Dichte (optional)
+            language: Sprache für die semantische Analyse
+        
+        Returns:
+            Lesbarkeit, semantische Analyse und Keyword-Dichte
+        """
+        analyzed = _analyze_text(text)
+        
+        return {
+            'readability': SEOAnalyzer.readability_metrics(analyzed),
+            'semantic_analysis': SEOAnalyzer.semantic_analysis(analyzed, language),
+            'keyword_density': SEOAnalyzer.keyword_density(analyzed, keywords) if keywords else {}
+        }
@@ -0,0 +1,24 @@
+"""
+Gemeinsamer Tokenizer für Wortzählung und SEO-Analyse.
+"""
+import re
+from typing import List
+
+# Vorkompilierter Wort-Tokenizer (Unicode-\w ohne '_', erfasst Umlaute und ß)
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+def tokenize(text: str) -> List[str]:
+    """
+    Zerlegt einen Text in kleingeschriebene Wort-Tokens.
+    
+    Wird von WordCounter und SEOAnalyzer gemeinsam genutzt, damit beide
+    Module identische Token liefern und ein Text nur einmal tokenisiert
+    werden muss.
+    
+    Args:
+        text: Eingabetext
+    
+    Returns:
+        Liste von Tokens
+    """
+    return TOKEN_RE.findall(text.lower())
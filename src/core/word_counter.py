@@ -1,49 +1,168 @@
 """
 Modul zur Wortzählung und Dokumentenanalyse.
 """
-import docx
-from typing import Dict, List, Optional
+import os
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-import re
+from lxml import etree
+
+from .tokenizer import tokenize
+
+# XML-Namespace von WordprocessingML (word/document.xml)
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Textinhalt von Run-Elementen (None: Text des Elements selbst)
+_RUN_CONTENT = {
+    _W_NS + 't': None,
+    _W_NS + 'tab': '\t',
+    _W_NS + 'ptab': '\t',
+    _W_NS + 'br': '\n',
+    _W_NS + 'cr': '\n',
+    _W_NS + 'noBreakHyphen': '-'
+}
 
 class WordCounter:
     """
     Klasse zur Analyse und Wortzählung von DOCX-Dokumenten.
     """
     @staticmethod
-    def count_words(document_path: str) -> Dict[str, int]:
+    def count_words(document_path: Union[str, IO[bytes]], include_counter: bool = False) -> Dict[str, int]:
         """
         Zählt die Wörter in einem DOCX-Dokument.
         
         Args:
-            document_path: Pfad zum DOCX-Dokument
+            document_path: Pfad zum DOCX-Dokument oder binäres File-Objekt
+            include_counter: Vollständige Wortzählung unter 'counter' mitliefern
         
         Returns:
             Dictionary mit Wortzählstatistiken
         """
         try:
-            doc = docx.Document(document_path)
-            
-            # Sammle Text aus allen Absätzen
-            full_text = []
-            for para in doc.paragraphs:
-                full_text.append(para.text)
-            
-            # Kombiniere den Text
-            text = ' '.join(full_text)
-            
-            # Bereinige und zähle Wörter
-            words = re.findall(r'\b\w+\b', text.lower())
+            try:
+                counts, total = WordCounter._count_tokens(
+                    WordCounter.iter_paragraphs(document_path)
+                )
+            except Exception:
+                # Fallback auf python-docx, falls das XML nicht direkt lesbar ist
+                # (erst hier importiert, da der lxml-Pfad ohne python-docx auskommt)
+                import docx
+                
+                if hasattr(document_path, 'seek'):
+                    document_path.seek(0)
+                doc = docx.Document(document_path)
+                counts, total = WordCounter._count_tokens(para.text for para in doc.paragraphs)
             
-            # Detaillierte Statistiken
-            return {
-                'total_words': len(words),
-                'unique_words': len(set(words)),
-                'word_frequency': WordCounter._get_word_frequency(words)
-            }
+            return WordCounter._build_statistics(counts, total, include_counter)
         except Exception as e:
             raise ValueError(f"Fehler beim Zählen der Wörter: {e}")
     
+    @staticmethod
+    def count_words_from_text(text: str, include_counter: bool = False) -> Dict[str, int]:
+        """
+        Zählt die Wörter in einem bereits extrahierten Text.
+        
+        Erlaubt es, ein einmal geparstes Dokument für Wortzählung und
+        SEO-Analyse gemeinsam zu verwenden.
+        
+        Args:
+            text: Vollständiger Text
+            include_counter: Vollständige Wortzählung unter 'counter' mitliefern
+        
+        Returns:
+            Dictionary mit Wortzählstatistiken
+        """
+        counts, total = WordCounter._count_tokens(text.splitlines())
+        return WordCounter._build_statistics(counts, total, include_counter)
+    
+    @staticmethod
+    def _build_statistics(counts: Counter, total: int, include_counter: bool) -> Dict[str, int]:
+        """
+        Erstellt die detaillierten Statistiken aus einer Wortzählung.
+        """
+        result = {
+            'total_words': total,
+            'unique_words': len(counts),
+            'word_frequency': dict(counts.most_common(10))
+        }
+        if include_counter:
+            result['counter'] = counts
+        return result
+    
+    @staticmethod
+    def _count_tokens(paragraphs: Iterable[str]) -> Tuple[Counter, int]:
+        """
+        Tokenisiert Absätze einzeln und zählt die Wörter, ohne den Gesamttext aufzubauen.
+        
+        Args:
+            paragraphs: Iterable mit Absatztexten
+        
+        Returns:
+            Tupel aus Wortfrequenzen und Gesamtwortanzahl
+        """
+        counts = Counter()
+        total = 0
+        for paragraph in paragraphs:
+            tokens = tokenize(paragraph)
+            counts.update(tokens)
+            total += len(tokens)
+        return counts, total
+    
+    @staticmethod
+    def iter_paragraphs(document_path: Union[str, IO[bytes]]) -> Iterator[str]:
+        """
+        Liest Absätze direkt aus word/document.xml ohne python-docx-DOM.
+        
+        Wie python-docx (doc.paragraphs) werden nur Absätze direkt im
+        Dokumentkörper gelesen; Tabellen, Textfelder, Kopf- und Fußzeilen
+        zählen nicht mit. Umbrüche und Tabs werden als Leerraum ausgegeben.
+        
+        Args:
+            document_path: Pfad zum DOCX-Dokument oder binäres File-Objekt
+        
+        Yields:
+            Text der einzelnen nicht-leeren Absätze
+        """
+        with zipfile.ZipFile(document_path) as archive:
+            with archive.open('word/document.xml') as stream:
+                for _, element in etree.iterparse(stream, tag=(_W_NS + 'p', _W_NS + 'tbl')):
+                    parent = element.getparent()
+                    # Verschachtelte Absätze (Tabellenzellen, Textfelder) überspringen
+                    if parent is None or parent.tag != _W_NS + 'body':
+                        continue
+                    
+                    if element.tag == _W_NS + 'p':
+                        text = WordCounter._paragraph_text(element)
+                        if text:
+                            yield text
+                    
+                    # Verarbeitete Elemente freigeben, damit der Speicher flach bleibt
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del parent[0]
+    
+    @staticmethod
+    def _paragraph_text(paragraph) -> str:
+        """
+        Setzt den Text eines w:p-Elements aus seinen Runs zusammen (wie python-docx).
+        
+        Args:
+            paragraph: w:p-Element
+        
+        Returns:
+            Absatztext inklusive Hyperlinks, Umbrüche und Tabs als Leerraum
+        """
+        parts = []
+        for child in paragraph.iterchildren(_W_NS + 'r', _W_NS + 'hyperlink'):
+            runs = child.iterchildren(_W_NS + 'r') if child.tag == _W_NS + 'hyperlink' else (child,)
+            for run in runs:
+                for content in run.iterchildren(*_RUN_CONTENT):
+                    text = _RUN_CONTENT[content.tag]
+                    parts.append((content.text or '') if text is None else text)
+        return ''.join(parts)
+    
     @staticmethod
     def _get_word_frequency(words: List[str], top_n: int = 10) -> Dict[str, int]:
         """
@@ -56,38 +175,32 @@ class WordCounter:
         Returns:
             Dictionary mit Wortfrequenzen
         """
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Sortiere nach Häufigkeit absteigend
-        return dict(sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:top_n])
+        # Sortiere nach Häufigkeit absteigend (Heap statt vollständiger Sortierung)
+        return dict(Counter(words).most_common(top_n))
     
     @staticmethod
-    def analyze_multiple_documents(document_paths: List[str]) -> List[Dict[str, int]]:
+    def analyze_multiple_documents(document_paths: List[str], max_workers: Optional[int] = None) -> List[Dict[str, int]]:
         """
-        Analysiert mehrere Dokumente.
+        Analysiert mehrere Dokumente parallel in separaten Prozessen.
         
         Args:
             document_paths: Liste der Dokumentpfade
+            max_workers: Anzahl der Worker-Prozesse (default: Anzahl CPU-Kerne,
+                höchstens Anzahl der Dokumente)
         
         Returns:
-            Liste von Wortzählstatistiken
+            Liste von Wortzählstatistiken in der Reihenfolge der Pfade
         """
-        results = []
-        for path in document_paths:
-            try:
-                results.append({
-                    'file': Path(path).name,
-                    **WordCounter.count_words(path)
-                })
-            except Exception as e:
-                results.append({
-                    'file': Path(path).name,
-                    'error': str(e)
-                })
-        
-        return results
+        if len(document_paths) <= 1:
+            return [_safe_count(path) for path in document_paths]
+        
+        # Nicht mehr Prozesse starten als Dokumente vorhanden sind
+        workers = min(max_workers or os.cpu_count() or 1, len(document_paths))
+        # Etwa vier Pakete pro Worker: wenig IPC-Overhead, trotzdem gute Lastverteilung
+        chunksize = max(1, len(document_paths) // (workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_safe_count, document_paths, chunksize=chunksize))
     
     @staticmethod
     def export_word_count_report(results: List[Dict[str, int]], output_path: Optional[str] = None) -> str:
@@ -104,22 +217,51 @@ class WordCounter:
         if not output_path:
             output_path = 'word_count_report.txt'
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("Wortanzahl-Bericht\n")
-            f.write("=" * 20 + "\n\n")
+        # Bericht im Speicher zusammensetzen und mit einem einzigen write schreiben
+        parts = ["Wortanzahl-Bericht\n", "=" * 20 + "\n\n"]
+        
+        for result in results:
+            parts.append(f"Datei: {result.get('file', 'Unbekannt')}\n")
             
-            for result in results:
-                f.write(f"Datei: {result.get('file', 'Unbekannt')}\n")
-                
-                if 'error' in result:
-                    f.write(f"Fehler: {result['error']}\n\n")
-                else:
-                    f.write(f"Gesamtwörter: {result.get('total_words', 0)}\n")
-                    f.write(f"Einzigartige Wörter: {result.get('unique_words', 0)}\n")
-                    
-                    f.write("Top 10 Wörter:\n")
-                    for word, freq in result.get('word_frequency', {}).items():
-                        f.write(f"  {word}: {freq}\n")
-                    f.write("\n")
+            if 'error' in result:
+                parts.append(f"Fehler: {result['error']}\n\n")
+            else:
+                parts.append(
+                    f"Gesamtwörter: {result.get('total_words', 0)}\n"
+                    f"Einzigartige Wörter: {result.get('unique_words', 0)}\n"
+                    "Top 10 Wörter:\n"
+                )
+                parts.extend(
+                    f"  {word}: {freq}\n"
+                    for word, freq in result.get('word_frequency', {}).items()
+                )
+                parts.append("\n")
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
         
-        return output_path
\ No newline at end of file
+        return output_path
+
+
+def _safe_count(path: str) -> Dict[str, int]:
+    """
+    Zählt die Wörter eines Dokuments, ohne Ausnahmen weiterzugeben.
+    
+    Muss auf Modulebene liegen, damit der ProcessPoolExecutor sie picklen kann.
+    
+    Args:
+        path: Pfad zum DOCX-Dokument
+    
+    Returns:
+        Wortzählstatistiken oder Fehlerbeschreibung
+    """
+    try:
+        return {
+            'file': Path(path).name,
+            **WordCounter.count_words(path)
+        }
+    except Exception as e:
+        return {
+            'file': Path(path).name,
+            'error': str(e)
+        }
\ No newline at end of file
@@ -2,6 +2,8 @@
 CLI-Schnittstelle für das Wortanzahl-Tool.
 """
 import typer
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from typing import List, Optional
 from pathlib import Path
 import rich
@@ -14,10 +16,14 @@ from src.core.word_counter import WordCounter
 app = typer.Typer(help="CLI-Tool zur Wortzählung in DOCX-Dokumenten.")
 console = Console()
 
+# Anzahl paralleler Google Drive-Downloads
+DOWNLOAD_WORKERS = 8
+
 @app.command("local")
 def count_local_files(
     files: List[Path] = typer.Argument(..., help="Pfade zu DOCX-Dateien"),
-    output: Optional[Path] = typer.Option(None, "-o", "--output", help="Pfad zur Ausgabedatei")
+    output: Optional[Path] = typer.Option(None, "-o", "--output", help="Pfad zur Ausgabedatei"),
+    workers: Optional[int] = typer.Option(None, "-w", "--workers", help="Anzahl paralleler Worker-Prozesse")
 ):
     """
     Zählt Wörter in lokalen DOCX-Dateien.
@@ -30,7 +36,7 @@ def count_local_files(
         file_paths = [str(file) for file in files]
         
         # Analysiere Dokumente
-        results = WordCounter.analyze_multiple_documents(file_paths)
+        results = WordCounter.analyze_multiple_documents(file_paths, max_workers=workers)
         
         # Zeige Ergebnisse in der Konsole
         _display_results(results)
@@ -56,8 +62,8 @@ def count_drive_files(
     python -m src.ui.cli drive --folder 1abc123 --output report.txt
     """
     try:
-        # Initialisiere Google Drive Client
-        drive_client = GoogleDriveClient()
+        # Google Drive Client (wird prozessweit wiederverwendet)
+        drive_client = _get_drive_client()
         
         # Dateien abrufen
         if query:
@@ -67,19 +73,31 @@ def count_drive_files(
         else:
             files = drive_client.list_docx_files()
         
-        # Dateien herunterladen und analysieren
-        results = []
-        for file in files:
-            try:
-                # Datei herunterladen
-                downloaded_file = drive_client.download_file(file['id'])
-                
-                # Wortzählung
-                result = WordCounter.count_words(downloaded_file)
-                result['file'] = file['name']
-                results.append(result)
-            except Exception as e:
-                console.print(f"[yellow]Fehler bei {file['name']}: {e}[/yellow]")
+        # Dateien parallel herunterladen und fertige Downloads sofort analysieren
+        results_by_id = {}
+        files_by_id = {file['id']: file for file in files}
+        with ProcessPoolExecutor() as analyzer:
+            analysis_futures = {}
+            for file_id, future in drive_client.iter_downloads(files_by_id, max_workers=DOWNLOAD_WORKERS):
+                file = files_by_id[file_id]
+                try:
+                    downloaded_file = future.result()
+                    analysis_futures[analyzer.submit(WordCounter.count_words, downloaded_file)] = file
+                except Exception as e:
+                    console.print(f"[yellow]Fehler bei {file['name']}: {e}[/yellow]")
+            
+            for future in as_completed(analysis_futures):
+                file = analysis_futures[future]
+                try:
+                    # Wortzählung
+                    result = future.result()
+                    result['file'] = file['name']
+                    results_by_id[file['id']] = result
+                except Exception as e:
+                    console.print(f"[yellow]Fehler bei {file['name']}: {e}[/yellow]")
+        
+        # Ursprüngliche Reihenfolge der Dateien beibehalten
+        results = [results_by_id[file['id']] for file in files if file['id'] in results_by_id]
         
         # Zeige Ergebnisse in der Konsole
         _display_results(results)
@@ -92,6 +110,13 @@ def count_drive_files(
     except Exception as e:
         console.print(f"[red]Fehler: {e}[/red]")
 
+@lru_cache(maxsize=1)
+def _get_drive_client() -> GoogleDriveClient:
+    """
+    Erstellt den Google Drive Client einmalig, damit Auth-Tokens wiederverwendet werden.
+    """
+    return GoogleDriveClient()
+
 def _display_results(results: List[dict]):
     """
     Zeigt Wortzählungsergebnisse in einer Rich-Tabelle an.
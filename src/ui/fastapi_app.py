@@ -1,10 +1,16 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
+import asyncio
+import io
+import logging
+import multiprocessing
 import os
 import sys
-import pandas as pd
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import List, Dict, Optional
 
 # Projektverzeichnis zum Python-Pfad hinzufügen
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -17,26 +23,55 @@ app = FastAPI()
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+@lru_cache(maxsize=1)
+def _get_process_pool() -> Optional[ProcessPoolExecutor]:
+    # Ein Worker-Pool pro Server-Prozess, erst beim ersten Upload gestartet;
+    # spawn statt fork, da der Server bereits Threads laufen hat
+    try:
+        return ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    except (OSError, NotImplementedError) as e:
+        # Serverless-Umgebungen (z. B. Vercel ohne /dev/shm) unterstützen keine Prozess-Pools
+        logging.warning(f"Kein Prozess-Pool verfügbar, Analyse läuft in Threads: {e}")
+        return None
+
+async def _count_words(file_bytes: bytes) -> Dict:
+    # Einen abgestürzten Pool (z. B. OOM-gekillter Worker) verwerfen und einmal neu versuchen
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = _get_process_pool()
+        if pool is None:
+            return await asyncio.to_thread(WordCounter.count_words, io.BytesIO(file_bytes))
+        try:
+            return await loop.run_in_executor(pool, WordCounter.count_words, io.BytesIO(file_bytes))
+        except BrokenProcessPool:
+            if attempt:
+                raise
+            logging.warning("Worker-Pool abgestürzt, starte neuen Pool")
+            if _get_process_pool() is pool:
+                _get_process_pool.cache_clear()
+            pool.shutdown(wait=False)
+
+async def _analyze_upload(uploaded_file: UploadFile) -> Dict:
+    # Parsen und Zählen in einem Worker-Prozess (am GIL vorbei), der Event-Loop bleibt frei;
+    # das gespoolte Upload-Objekt ist nicht picklebar, daher werden die Bytes übergeben
+    file_bytes = await uploaded_file.read()
+    result = await _count_words(file_bytes)
+    result['file'] = uploaded_file.filename
+    return result
+
 @app.post("/analyze/")
 async def analyze_files(files: List[UploadFile] = File(...)):
-    results = []
     for uploaded_file in files:
         if uploaded_file.size > 10 * 1024 * 1024:  # 10MB limit
             raise HTTPException(status_code=400, detail=f"File {uploaded_file.filename} exceeds size limit")
-            
-        temp_path = os.path.join(project_root, 'temp', uploaded_file.filename)
-        os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-        
-        with open(temp_path, 'wb') as f:
-            f.write(await uploaded_file.read())
-        
-        result = WordCounter.count_words(temp_path)
-        result['file'] = uploaded_file.filename
-        results.append(result)
-        
-        os.remove(temp_path)
     
-    return {"results": results}
+    # Alle Dateien gleichzeitig analysieren
+    results = await asyncio.gather(*(_analyze_upload(uploaded_file) for uploaded_file in files))
+    
+    return {"results": list(results)}
 
 @app.get("/", response_class=HTMLResponse)
 async def main():
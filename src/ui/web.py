@@ -1,7 +1,13 @@
 import os
 import sys
+import io
+import hashlib
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
 import streamlit as st
-import pandas as pd
 
 # Projektverzeichnis zum Python-Pfad hinzufügen
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -19,52 +25,151 @@ def main():
     )
     
     if uploaded_files:
-        results = []
-        for uploaded_file in uploaded_files:
-            # Temporäre Datei speichern
-            temp_path = os.path.join(project_root, 'temp', uploaded_file.name)
-            os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-            
-            with open(temp_path, 'wb') as f:
-                f.write(uploaded_file.getbuffer())
-            
-            result = WordCounter.count_words(temp_path)
-            result['file'] = uploaded_file.name
-            results.append(result)
-            
-            # Temporäre Datei löschen
-            os.remove(temp_path)
+        items = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+        
+        # Dateien parallel an den Worker-Pool übergeben (Cache-Treffer bleiben im Hauptprozess)
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            results = list(executor.map(_analyze_upload, items))
         
         display_results(results)
 
+def _analyze_upload(item):
+    """
+    Analysiert eine hochgeladene Datei und liefert Fehler als Ergebnis statt Ausnahme.
+    
+    Args:
+        item: Tupel aus Dateiname und Dateiinhalt
+    
+    Returns:
+        Wortzählstatistiken mit Dateiname
+    """
+    file_name, file_bytes = item
+    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    
+    try:
+        result = dict(analyze_document(file_hash, file_bytes))
+    except Exception as e:
+        result = {'error': str(e)}
+    result['file'] = file_name
+    result['file_hash'] = file_hash
+    return result
+
+@st.cache_resource
+def _get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Liefert den prozessweiten Worker-Pool, der Streamlit-Reruns überdauert.
+    
+    Die Worker werden per spawn gestartet, da ein fork des mehrthreadigen
+    Streamlit-Servers nicht sicher ist.
+    
+    Returns:
+        ProcessPoolExecutor mit einem Worker pro CPU-Kern oder None, falls die
+        Umgebung keine Prozess-Pools unterstützt
+    """
+    try:
+        return ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    except (OSError, NotImplementedError) as e:
+        logging.warning(f"Kein Prozess-Pool verfügbar, Analyse läuft im Server-Prozess: {e}")
+        return None
+
+def _run_in_pool(func, *args):
+    """
+    Führt eine Funktion im Worker-Pool aus und ersetzt einen abgestürzten Pool.
+    
+    Stirbt ein Worker (z. B. OOM bei einem sehr großen Dokument), ist der Pool
+    dauerhaft unbrauchbar. Er wird dann verworfen und der Aufruf einmal mit
+    einem neuen Pool wiederholt. Ohne Pool läuft die Funktion direkt.
+    
+    Args:
+        func: Auszuführende (picklebare) Funktion
+        args: Argumente der Funktion
+    
+    Returns:
+        Rückgabewert der Funktion
+    """
+    for attempt in range(2):
+        pool = _get_process_pool()
+        if pool is None:
+            return func(*args)
+        try:
+            return pool.submit(func, *args).result()
+        except BrokenProcessPool:
+            if attempt:
+                raise
+            logging.warning("Worker-Pool abgestürzt, starte neuen Pool")
+            # Nur verwerfen, falls nicht bereits ein anderer Thread ersetzt hat
+            if _get_process_pool() is pool:
+                _get_process_pool.clear()
+            pool.shutdown(wait=False)
+
+@st.cache_data(max_entries=128, ttl=3600, show_spinner=False)
+def analyze_document(file_hash: str, _file_bytes: bytes) -> dict:
+    """
+    Analysiert ein hochgeladenes DOCX-Dokument direkt aus dem Speicher.
+    
+    Der Cache ist prozessweit und über den Inhalts-Hash adressiert, sodass
+    identische Uploads (auch aus anderen Sessions) nicht erneut analysiert werden.
+    Einträge verfallen nach einer Stunde. Die Analyse selbst läuft in einem
+    Worker-Prozess, damit Tokenisierung und Zählung nicht am GIL hängen.
+    
+    Args:
+        file_hash: SHA-256 des Dateiinhalts (Cache-Schlüssel)
+        _file_bytes: Dateiinhalt (wird von Streamlit nicht gehasht)
+    
+    Returns:
+        Wortzählstatistiken
+    """
+    return _run_in_pool(WordCounter.count_words, io.BytesIO(_file_bytes), True)
+
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def _corpus_totals(file_hashes: tuple, _results: list) -> tuple:
+    """
+    Berechnet die korpusweiten Kennzahlen einmal pro Upload-Kombination.
+    
+    Args:
+        file_hashes: SHA-256 der Dateiinhalte (Cache-Schlüssel)
+        _results: Wortzählstatistiken mit vollständiger Zählung (wird nicht gehasht)
+    
+    Returns:
+        Tupel aus Gesamtwörtern und korpusweit einzigartigen Wörtern
+    """
+    total_words = sum(result.get('total_words', 0) for result in _results)
+    # Wörter aus mehreren Dokumenten nur einmal als einzigartig werten
+    unique_words = len(set().union(*(result.get('counter', {}) for result in _results)))
+    return total_words, unique_words
+
 def display_results(results):
     st.subheader("📊 Analyseergebnisse")
     
-    total_words = sum(result.get('total_words', 0) for result in results)
-    unique_words = sum(result.get('unique_words', 0) for result in results)
+    total_words, unique_words = _corpus_totals(
+        tuple(result.get('file_hash') for result in results), results
+    )
     
     col1, col2, col3 = st.columns(3)
     col1.metric("📄 Dokumente", len(results))
     col2.metric("📝 Gesamtwörter", total_words)
     col3.metric("🔤 Einzigartige Wörter", unique_words)
     
+    # Eine Tabelle für alle Dateien statt Überschrift, Metriken und Tabelle pro Datei
+    rows = []
     for result in results:
-        st.markdown(f"## 📄 {result.get('file', 'Unbekannt')}")
-        
-        col1, col2 = st.columns(2)
+        # WordCounter liefert bereits die sortierten Top 10
+        word_freq = result.get('word_frequency', {})
         
-        with col1:
-            st.metric("Wörter", result.get('total_words', 0))
-            st.metric("Einzigartige Wörter", result.get('unique_words', 0))
-        
-        with col2:
-            word_freq = result.get('word_frequency', {})
-            top_words = dict(sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10])
-            
-            st.write("### Top 10 Wörter")
-            st.table(pd.DataFrame.from_dict(top_words, orient='index', columns=['Häufigkeit']))
-        
-        st.markdown("---")
+        row = {
+            'Datei': result.get('file', 'Unbekannt'),
+            'Wörter': result.get('total_words', 0),
+            'Einzigartige Wörter': result.get('unique_words', 0),
+            'Top 10 Wörter': ', '.join(f"{word} ({freq})" for word, freq in word_freq.items())
+        }
+        if 'error' in result:
+            row['Fehler'] = result['error']
+        rows.append(row)
+    
+    st.dataframe(rows, hide_index=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,34 @@
+import pytest
+from src.api.docx_processor import DocxProcessor
+
+class TestDocxProcessor:
+    @pytest.mark.unit
+    def test_read_docx_files_separates_breaks_and_ignores_tables(self, tmp_path):
+        """
+        Testet Zeilenumbrüche und Tabellen beim Einlesen eines Verzeichnisses.
+        """
+        from docx import Document
+        doc = Document()
+        paragraph = doc.add_paragraph("Hallo")
+        paragraph.add_run().add_break()
+        paragraph.add_run("Welt")
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = "Zelle"
+        doc.save(tmp_path / 'umbruch.docx')
+
+        documents = DocxProcessor.read_docx_files(str(tmp_path))
+
+        assert len(documents) == 1
+        assert documents[0]['text'] == 'Hallo\nWelt'
+        assert documents[0]['word_count'] == 2
+
+    @pytest.mark.unit
+    def test_read_docx_files_logs_empty_files(self, tmp_path, caplog):
+        """
+        Testet, dass leere DOCX-Dateien nicht stillschweigend übersprungen werden.
+        """
+        (tmp_path / 'leer.docx').write_bytes(b'')
+
+        documents = DocxProcessor.read_docx_files(str(tmp_path))
+
+        assert documents == []
+        assert 'leer.docx' in caplog.text
@@ -0,0 +1,79 @@
+import pytest
+
+pytest.importorskip('googleapiclient')
+pytest.importorskip('google_auth_oauthlib')
+
+from src.api import drive
+from src.api.drive import GoogleDriveClient
+
+class _Response:
+    def __init__(self, value):
+        self.value = value
+
+    def execute(self):
+        return self.value
+
+class _FakeFiles:
+    def __init__(self, files):
+        self.files = files
+
+    def get(self, fileId, fields):
+        return _Response({'name': self.files[fileId][0]})
+
+    def get_media(self, fileId):
+        return self.files[fileId][1]
+
+class _FakeService:
+    def __init__(self, files):
+        self._files = _FakeFiles(files)
+
+    def files(self):
+        return self._files
+
+class _FakeDownload:
+    def __init__(self, fd, request, chunksize):
+        self.fd = fd
+        self.request = request
+
+    def next_chunk(self):
+        self.fd.write(self.request)
+        return None, True
+
+class _PickledCredentials:
+    def to_json(self):
+        return '{"token": "alt"}'
+
+class TestGoogleDriveClient:
+    @pytest.mark.unit
+    def test_download_files_keeps_same_named_files_apart(self, tmp_path, monkeypatch):
+        """
+        Testet, dass gleichnamige Dateien parallel unter eigenen Pfaden landen.
+        """
+        service = _FakeService({
+            'id1': ('bericht.docx', b'erste Datei'),
+            'id2': ('bericht.docx', b'zweite Datei')
+        })
+        monkeypatch.setattr(drive, '_get_drive_service', lambda credentials_path, token_path: service)
+        monkeypatch.setattr(drive, 'MediaIoBaseDownload', _FakeDownload)
+        monkeypatch.chdir(tmp_path)
+
+        paths = GoogleDriveClient().download_files(['id1', 'id2'])
+
+        assert len(set(paths)) == 2
+        assert [(tmp_path / path).read_bytes() for path in paths] == [b'erste Datei', b'zweite Datei']
+
+    @pytest.mark.unit
+    def test_pickle_token_is_migrated_to_json(self, tmp_path):
+        """
+        Testet, dass ein vorhandenes token.pickle einmalig als token.json übernommen wird.
+        """
+        import pickle
+
+        with open(tmp_path / 'token.pickle', 'wb') as token:
+            pickle.dump(_PickledCredentials(), token)
+        token_path = tmp_path / 'token.json'
+
+        creds = drive._migrate_pickle_token(str(token_path))
+
+        assert isinstance(creds, _PickledCredentials)
+        assert token_path.read_text(encoding='utf-8') == '{"token": "alt"}'
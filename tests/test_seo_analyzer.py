@@ -0,0 +1,341 @@
+import math
+import pytest
+from src.core.seo_analyzer import SEOAnalyzer
+
+class TestSEOAnalyzer:
+    @pytest.mark.seo
+    def test_calculate_tf_idf_uses_max_over_documents(self):
+        """
+        Testet, dass spätere Dokumente höhere TF-IDF-Werte nicht überschreiben.
+        """
+        documents = [
+            "seo seo seo text",
+            "seo analyse",
+            "wort zahl"
+        ]
+
+        result = SEOAnalyzer.calculate_tf_idf(documents)
+
+        # 'seo' kommt in 2 von 3 Dokumenten vor -> idf = log(3/3) = 0
+        assert result['seo'] == 0
+        # 'text' hat im ersten Dokument tf = 1/4
+        assert result['text'] == pytest.approx(0.25 * 0.4054651081081644)
+        # Unabhängig von der Dokumentreihenfolge und gleich im NumPy-Pfad
+        assert SEOAnalyzer.calculate_tf_idf(documents[::-1]) == pytest.approx(result)
+        assert SEOAnalyzer.calculate_tf_idf_batch(documents) == pytest.approx(result)
+        # Höchster Wert steht vorne
+        assert list(result.values()) == sorted(result.values(), reverse=True)
+
+    @pytest.mark.seo
+    def test_keyword_density_counts_whole_words(self):
+        """
+        Testet die Keyword-Dichte auf Basis ganzer Tokens.
+        """
+        text = "Art und Kunst. Die Karte zeigt Art."
+
+        result = SEOAnalyzer.keyword_density(text, ['art', 'Kunst'])
+
+        # 'art' in 'Karte' darf nicht mitgezählt werden
+        assert result['art'] == pytest.approx(2 / 7 * 100)
+        assert result['Kunst'] == pytest.approx(1 / 7 * 100)
+
+    @pytest.mark.seo
+    def test_semantic_analysis_filters_stopwords(self):
+        """
+        Testet, dass Stopwords aus der semantischen Analyse entfernt werden.
+        """
+        result = SEOAnalyzer.semantic_analysis("Der Text und der Text und die Analyse")
+
+        top_words = dict(result['top_meaningful_words'])
+        assert 'der' not in top_words
+        assert 'und' not in top_words
+        assert top_words['text'] == 2
+        assert result['unique_meaningful_words'] == 2
+
+    @pytest.mark.seo
+    def test_calculate_tf_idf_numba_matches_python(self, monkeypatch):
+        """
+        Testet, dass der Numba-Pfad dieselben Werte liefert wie der Python-Pfad.
+        """
+        pytest.importorskip('numba')
+        from src.core import seo_analyzer
+
+        documents = ["seo text analyse text", "wort zahl seo", "text", ""]
+        expected = SEOAnalyzer.calculate_tf_idf(documents)
+
+        monkeypatch.setattr(seo_analyzer, '_NUMBA_MIN_TOKENS', 0)
+        result = SEOAnalyzer.calculate_tf_idf(documents)
+
+        assert result.keys() == expected.keys()
+        for term, score in expected.items():
+            assert result[term] == pytest.approx(score)
+
+    @pytest.mark.seo
+    def test_analyze_all_shares_tokenization(self):
+        """
+        Testet die kombinierte Analyse auf einem einmalig tokenisierten Text.
+        """
+        text = "Der Hund läuft. Die Katze schläft! Der Hund bellt?"
+
+        result = SEOAnalyzer.analyze_all(text, keywords=['Hund'])
+
+        assert result['keyword_density']['Hund'] == pytest.approx(2 / 9 * 100)
+        assert dict(result['semantic_analysis']['top_meaningful_words'])['hund'] == 2
+        # 9 Wörter, 3 Sätze, 10 Silben
+        readability = result['readability']
+        assert readability['flesch_reading_ease'] == pytest.approx(206.835 - 1.015 * 3 - 84.6 * 10 / 9)
+        assert readability['complexity_level'] == SEOAnalyzer._get_complexity_level(readability['flesch_reading_ease'])
+
+    @pytest.mark.seo
+    def test_keyword_density_multi_word_keyword(self):
+        """
+        Testet die Keyword-Dichte für Keywords aus mehreren Wörtern.
+        """
+        text = "SEO Analyse hilft. Eine gute SEO Analyse zählt Wörter."
+
+        result = SEOAnalyzer.keyword_density(text, ['SEO Analyse', 'seo'])
+
+        assert result['SEO Analyse'] == pytest.approx(2 / 9 * 100)
+        assert result['seo'] == pytest.approx(2 / 9 * 100)
+
+    @pytest.mark.seo
+    def test_calculate_tf_idf_batch_matches_python(self):
+        """
+        Testet, dass die vektorisierte Variante dieselben Werte liefert.
+        """
+        documents = ["seo text analyse text", "", "wort zahl seo", "text", "seo seo", ""]
+        expected = SEOAnalyzer.calculate_tf_idf(documents)
+
+        result = SEOAnalyzer.calculate_tf_idf_batch(documents)
+
+        assert result.keys() == expected.keys()
+        for term, score in expected.items():
+            assert result[term] == pytest.approx(score)
+
+    @pytest.mark.seo
+    def test_readability_metrics_empty_text(self):
+        """
+        Testet den Fallback der Lesbarkeitsmetriken für leeren Text.
+        """
+        result = SEOAnalyzer.readability_metrics("")
+
+        assert result['flesch_reading_ease'] == 0
+        assert result['complexity_level'] == 'Unbekannt'
+
+    @pytest.mark.seo
+    def test_calculate_wdf_idf(self):
+        """
+        Testet WDF-IDF mit logarithmisch skalierter Termfrequenz.
+        """
+        documents = ["seo seo text", "text analyse", "wort"]
+
+        result = SEOAnalyzer.calculate_wdf_idf(documents)
+
+        # 'seo' kommt zweimal in 1 von 3 Dokumenten vor
+        assert result['seo'] == pytest.approx(math.log(3) * math.log(3 / 2))
+        # 'text' kommt in 2 von 3 Dokumenten vor -> idf = log(3/3) = 0
+        assert result['text'] == 0
+        assert list(result.values()) == sorted(result.values(), reverse=True)
+
+    @pytest.mark.seo
+    def test_calculate_wdf_idf_batch_matches_python(self):
+        """
+        Testet, dass die vektorisierte WDF-IDF-Variante dieselben Werte liefert.
+        """
+        documents = ["seo text analyse text", "", "wort zahl seo", "text", "seo seo", ""]
+        expected = SEOAnalyzer.calculate_wdf_idf(documents)
+
+        result = SEOAnalyzer.calculate_wdf_idf_batch(documents)
+
+        assert result.keys() == expected.keys()
+        for term, score in expected.items():
+            assert result[term] == pytest.approx(score)
+
+    @pytest.mark.seo
+    def test_keyword_density_multi_word_matches_whole_words(self):
+        """
+        Testet, dass Mehrwort-Keywords nur auf ganze Tokens passen.
+        """
+        text = "SEO Analysen helfen. Die SEO Analyse zählt."
+
+        result = SEOAnalyzer.keyword_density(text, ['SEO Analyse', 'seo analyse zählt', ''])
+
+        assert result['SEO Analyse'] == pytest.approx(1 / 7 * 100)
+        assert result['seo analyse zählt'] == pytest.approx(1 / 7 * 100)
+        assert result[''] == 0
+
+    @pytest.mark.seo
+    def test_duplicate_documents_count_towards_document_frequency(self):
+        """
+        Testet, dass doppelte Dokumente einmal verarbeitet, aber mehrfach gezählt werden.
+        """
+        documents = ["seo text", "wort", "seo text", "analyse"]
+
+        tf_idf = SEOAnalyzer.calculate_tf_idf(documents)
+        wdf_idf = SEOAnalyzer.calculate_wdf_idf(documents)
+
+        # 'seo' kommt in 2 von 4 Dokumenten vor -> idf = log(4/3)
+        assert tf_idf['seo'] == pytest.approx(0.5 * math.log(4 / 3))
+        assert wdf_idf['seo'] == pytest.approx(math.log(2) * math.log(4 / 3))
+        assert tf_idf == pytest.approx(SEOAnalyzer.calculate_tf_idf_batch(documents))
+        assert wdf_idf == pytest.approx(SEOAnalyzer.calculate_wdf_idf_batch(documents))
+
+    @pytest.mark.seo
+    def test_safe_tokenize_returns_alnum_tokens(self, monkeypatch):
+        """
+        Testet, dass Regex- und NLTK-Pfad nur alphanumerische Tokens liefern.
+        """
+        from src.core import seo_analyzer
+
+        text = "Schöne SEO-Texte, z.B. snake_case und 2024!"
+
+        tokens = SEOAnalyzer.safe_tokenize(text)
+        assert tokens and all(token.isalnum() for token in tokens)
+        assert 'snake_case' not in tokens
+
+        def failing_word_tokenize(text_lower, language):
+            raise LookupError("punkt")
+
+        monkeypatch.setattr(seo_analyzer, '_word_tokenize', failing_word_tokenize)
+        fallback_tokens = SEOAnalyzer.safe_tokenize(text, linguistic=True)
+        assert fallback_tokens == tokens
+
+    @pytest.mark.seo
+    def test_top_k_returns_highest_scores(self):
+        """
+        Testet, dass top_k die höchsten Werte in absteigender Reihenfolge liefert.
+        """
+        documents = ["seo seo seo text", "seo analyse", "wort zahl wort"]
+
+        for method in (SEOAnalyzer.calculate_tf_idf, SEOAnalyzer.calculate_wdf_idf):
+            full = method(documents)
+            top = method(documents, top_k=2)
+
+            assert list(top.items()) == list(full.items())[:2]
+
+    @pytest.mark.seo
+    def test_prepared_corpus_matches_documents(self):
+        """
+        Testet, dass ein vorbereiteter Korpus dieselben Werte liefert wie die Rohtexte.
+        """
+        documents = ["seo text analyse text", "wort zahl seo", "seo text analyse text", "text"]
+        corpus = SEOAnalyzer.prepare(documents)
+
+        assert corpus.total_docs == 4
+        assert len(corpus.term_counts) == 3
+        assert SEOAnalyzer.calculate_tf_idf(corpus) == SEOAnalyzer.calculate_tf_idf(documents)
+        assert SEOAnalyzer.calculate_wdf_idf(corpus) == SEOAnalyzer.calculate_wdf_idf(documents)
+
+    @pytest.mark.seo
+    def test_calculate_wdf_idf_streaming_matches_python(self):
+        """
+        Testet, dass die Streaming-Variante mit einem Generator dieselben Werte liefert.
+        """
+        documents = ["seo text analyse text", "", "wort zahl seo", "text", "seo seo", "wort zahl seo"]
+        expected = SEOAnalyzer.calculate_wdf_idf(documents)
+
+        result = SEOAnalyzer.calculate_wdf_idf_streaming(doc for doc in documents)
+
+        assert list(result) == list(expected)
+        for term, score in expected.items():
+            assert result[term] == pytest.approx(score)
+
+    @pytest.mark.seo
+    def test_batch_top_k_matches_python(self):
+        """
+        Testet, dass top_k in den vektorisierten Varianten auch bei Gleichständen übereinstimmt.
+        """
+        documents = ["seo text analyse text", "wort zahl seo", "text", "seo seo", "eins zwei drei"]
+
+        for top_k in (0, 1, 3, 5, 100):
+            expected = SEOAnalyzer.calculate_tf_idf(documents, top_k=top_k)
+            result = SEOAnalyzer.calculate_tf_idf_batch(documents, top_k=top_k)
+            assert list(result) == list(expected)
+            assert list(result.values()) == pytest.approx(list(expected.values()))
+
+            expected = SEOAnalyzer.calculate_wdf_idf(documents, top_k=top_k)
+            result = SEOAnalyzer.calculate_wdf_idf_batch(documents, top_k=top_k)
+            assert list(result) == list(expected)
+            assert list(result.values()) == pytest.approx(list(expected.values()))
+
+    @pytest.mark.seo
+    def test_ties_are_ranked_by_term(self):
+        """
+        Testet, dass gleiche Werte unabhängig von Dokumentreihenfolge und Pfad nach Term sortiert werden.
+        """
+        # Wiederholte Dokumente ordnet PreparedCorpus nach ihrem letzten Vorkommen um
+        documents = ["zeta beta", "gamma alpha", "zeta beta", "epsilon", "delta"]
+
+        for top_k in (None, 1, 2, 3):
+            for calculate in (SEOAnalyzer.calculate_tf_idf, SEOAnalyzer.calculate_tf_idf_batch):
+                result = calculate(documents, top_k=top_k)
+                assert list(result) == sorted(result, key=lambda term: (-result[term], term))
+            expected = SEOAnalyzer.calculate_tf_idf(documents, top_k=top_k)
+            assert list(SEOAnalyzer.calculate_tf_idf_batch(documents, top_k=top_k)) == list(expected)
+
+        # 'alpha' und 'gamma' haben denselben Wert -> alphabetisch
+        assert list(SEOAnalyzer.calculate_tf_idf(documents, top_k=2)) == ['delta', 'epsilon']
+        assert list(SEOAnalyzer.calculate_tf_idf(documents))[2:4] == ['alpha', 'gamma']
+
+    @pytest.mark.seo
+    def test_text_cache_keys_on_digest(self):
+        """
+        Testet, dass gleiche Texte einen Cache-Treffer liefern, ohne den Text zu speichern.
+        """
+        from src.core import seo_analyzer
+
+        text = "seo text " * 10
+        first = seo_analyzer._analyze_text(text)
+
+        assert seo_analyzer._analyze_text("".join(["seo text "] * 10)) is first
+        assert not hasattr(first, 'raw')
+
+    @pytest.mark.seo
+    def test_vendored_german_stopwords_load_without_nltk(self, monkeypatch):
+        """
+        Testet, dass die mitgelieferten deutschen Stopwords ohne NLTK geladen werden.
+        """
+        from src.core import seo_analyzer
+
+        def failing_nltk(*resources, language='german'):
+            raise AssertionError("NLTK darf für Deutsch nicht geladen werden")
+
+        monkeypatch.setattr(seo_analyzer, '_nltk', failing_nltk)
+        seo_analyzer._load_stopwords.cache_clear()
+        try:
+            stopwords = seo_analyzer._load_stopwords('german')
+        finally:
+            seo_analyzer._load_stopwords.cache_clear()
+
+        # 'auch' fehlt in den Fallback-Stopwords, stammt also aus src/nltk_data
+        assert 'auch' in stopwords
+        assert len(stopwords) == 232
+
+    @pytest.mark.seo
+    def test_stopwords_for_other_languages_come_from_nltk(self, tmp_path, monkeypatch):
+        """
+        Testet, dass andere Sprachen die NLTK-Datei ihrer Sprache nutzen.
+        """
+        nltk = pytest.importorskip('nltk')
+        from src.core import seo_analyzer
+
+        corpus = tmp_path / 'corpora' / 'stopwords'
+        corpus.mkdir(parents=True)
+        (corpus / 'english').write_text("the\nand\nof\n", encoding='utf-8')
+
+        requested = []
+        monkeypatch.setattr(seo_analyzer, 'download_nltk_resources',
+                            lambda language='german', resources=None: requested.append((language, resources)))
+        monkeypatch.setattr(nltk.data, 'path', [str(tmp_path)])
+        seo_analyzer._nltk.cache_clear()
+        seo_analyzer._load_stopwords.cache_clear()
+        try:
+            result = SEOAnalyzer.semantic_analysis("The art of SEO and the art of text", 'english')
+        finally:
+            seo_analyzer._nltk.cache_clear()
+            seo_analyzer._load_stopwords.cache_clear()
+
+        top_words = dict(result['top_meaningful_words'])
+        assert 'the' not in top_words and 'and' not in top_words and 'of' not in top_words
+        assert top_words['art'] == 2
+        assert requested == [('english', ('stopwords',))]
@@ -1,70 +1,210 @@
+import io
 import pytest
 import os
 from src.core.word_counter import WordCounter
 
+def _docx_buffer(*paragraphs):
+    """
+    Erstellt ein DOCX-Dokument vollständig im Speicher.
+    """
+    from docx import Document
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+@pytest.fixture(scope='session')
+def test_documents(tmp_path_factory):
+    """
+    Erstellt die Test-Dokumente einmalig pro Testlauf in einem temporären Verzeichnis.
+    """
+    from docx import Document
+    directory = tmp_path_factory.mktemp('test_documents')
+    paragraphs = {
+        'multi_0.docx': "Ein Wort",
+        'multi_1.docx': "Zwei Wörter hier"
+    }
+    
+    paths = {}
+    for name, text in paragraphs.items():
+        (directory / name).write_bytes(_docx_buffer(text).getvalue())
+        paths[name] = str(directory / name)
+    
+    # Ein auf zwei Runs verteiltes Wort
+    doc = Document()
+    paragraph = doc.add_paragraph("Wo")
+    paragraph.add_run("rt")
+    doc.add_paragraph("Zweiter Absatz")
+    doc.save(directory / 'split_runs.docx')
+    paths['split_runs.docx'] = str(directory / 'split_runs.docx')
+    
+    return paths
+
 class TestWordCounter:
     @pytest.mark.unit
-    def test_count_words_basic(self):
+    @pytest.mark.parametrize('paragraphs,expected_total,expected_unique', [
+        (["Dies ist ein Testdokument mit mehreren Wörtern."], 7, 7),
+        ([], 0, 0)
+    ], ids=['basic', 'empty_document'])
+    def test_count_words(self, paragraphs, expected_total, expected_unique):
         """
-        Testet die grundlegende Wortzählung.
+        Testet die grundlegende Wortzählung, auch für ein leeres Dokument.
         """
-        # Erstelle eine Testdatei
-        test_docx_path = os.path.join('test_documents', 'test_word_count.docx')
-        os.makedirs('test_documents', exist_ok=True)
-        
-        from docx import Document
-        doc = Document()
-        doc.add_paragraph("Dies ist ein Testdokument mit mehreren Wörtern.")
-        doc.save(test_docx_path)
-        
         # Führe Wortzählung durch
-        result = WordCounter.count_words(test_docx_path)
+        result = WordCounter.count_words(_docx_buffer(*paragraphs))
         
         # Überprüfe Ergebnisse
-        assert 'total_words' in result
-        assert 'unique_words' in result
-        assert 'word_frequency' in result
+        assert result['total_words'] == expected_total
+        assert result['unique_words'] == expected_unique
+        assert len(result['word_frequency']) == min(expected_unique, 10)
+    
+    @pytest.mark.unit
+    def test_get_word_frequency(self):
+        """
+        Testet die Wortfrequenz-Funktion.
+        """
+        words = ['test', 'wort', 'test', 'analyse', 'wort', 'test']
         
-        assert result['total_words'] > 0
-        assert result['unique_words'] > 0
+        frequency = WordCounter._get_word_frequency(words)
         
-        # Räume auf
-        os.remove(test_docx_path)
+        assert len(frequency) > 0
+        assert 'test' in frequency
+        assert frequency['test'] == 3
+        assert frequency['wort'] == 2
     
     @pytest.mark.unit
-    def test_count_words_empty_document(self):
+    def test_count_words_joins_split_runs(self, test_documents):
         """
-        Testet die Wortzählung für ein leeres Dokument.
+        Testet, dass auf mehrere Runs verteilte Wörter als ein Wort zählen.
         """
-        # Erstelle eine leere Testdatei
-        test_docx_path = os.path.join('test_documents', 'empty_document.docx')
-        os.makedirs('test_documents', exist_ok=True)
+        result = WordCounter.count_words(test_documents['split_runs.docx'])
         
-        from docx import Document
-        doc = Document()
-        doc.save(test_docx_path)
+        assert result['total_words'] == 3
+        assert result['word_frequency']['wort'] == 1
+    
+    @pytest.mark.unit
+    def test_analyze_multiple_documents_keeps_order(self, test_documents):
+        """
+        Testet die parallele Analyse mehrerer Dokumente inklusive Fehlerfall.
+        """
+        paths = [test_documents['multi_0.docx'], test_documents['multi_1.docx']]
+        paths.append(os.path.join(os.path.dirname(paths[0]), 'fehlt.docx'))
         
-        # Führe Wortzählung durch
-        result = WordCounter.count_words(test_docx_path)
+        results = WordCounter.analyze_multiple_documents(paths, max_workers=2)
         
-        # Überprüfe Ergebnisse
-        assert result['total_words'] == 0
-        assert result['unique_words'] == 0
-        assert len(result['word_frequency']) == 0
+        assert [result['file'] for result in results] == ['multi_0.docx', 'multi_1.docx', 'fehlt.docx']
+        assert results[0]['total_words'] == 2
+        assert results[1]['total_words'] == 3
+        assert 'error' in results[2]
+    
+    @pytest.mark.unit
+    def test_count_words_from_file_object(self):
+        """
+        Testet die Wortzählung direkt aus einem In-Memory-File-Objekt.
+        """
+        result = WordCounter.count_words(_docx_buffer("Ohne temporäre Datei zählen"))
         
-        # Räume auf
-        os.remove(test_docx_path)
+        assert result['total_words'] == 4
+        assert result['unique_words'] == 4
     
     @pytest.mark.unit
-    def test_get_word_frequency(self):
+    def test_count_words_include_counter(self):
         """
-        Testet die Wortfrequenz-Funktion.
+        Testet die optionale Rückgabe der vollständigen Wortzählung.
         """
-        words = ['test', 'wort', 'test', 'analyse', 'wort', 'test']
+        buffer = _docx_buffer("eins zwei zwei")
         
-        frequency = WordCounter._get_word_frequency(words)
+        result = WordCounter.count_words(buffer, include_counter=True)
         
-        assert len(frequency) > 0
-        assert 'test' in frequency
-        assert frequency['test'] == 3
-        assert frequency['wort'] == 2
\ No newline at end of file
+        assert result['counter'] == {'eins': 1, 'zwei': 2}
+        assert 'counter' not in WordCounter.count_words(buffer)
+    
+    @pytest.mark.unit
+    def test_count_words_from_text(self):
+        """
+        Testet die Wortzählung auf bereits extrahiertem Text.
+        """
+        result = WordCounter.count_words_from_text("Test eins\nTest zwei")
+        
+        assert result['total_words'] == 4
+        assert result['unique_words'] == 3
+        assert result['word_frequency']['test'] == 2
+
+    @pytest.mark.unit
+    def test_count_words_from_text_ignores_underscores(self):
+        """
+        Testet, dass Unterstriche (z.B. Ausfülllinien) keine Wörter bilden.
+        """
+        result = WordCounter.count_words_from_text("Name: __________\nsnake_case")
+        
+        assert result['total_words'] == 3
+        assert '__________' not in result['word_frequency']
+
+    @pytest.mark.unit
+    def test_export_word_count_report(self, tmp_path):
+        """
+        Testet den Textbericht für erfolgreiche und fehlerhafte Analysen.
+        """
+        results = [
+            {'file': 'a.docx', 'total_words': 3, 'unique_words': 2, 'word_frequency': {'seo': 2, 'text': 1}},
+            {'file': 'b.docx', 'error': 'kaputt'}
+        ]
+        output_path = tmp_path / 'report.txt'
+        
+        assert WordCounter.export_word_count_report(results, str(output_path)) == str(output_path)
+        
+        assert output_path.read_text(encoding='utf-8') == (
+            "Wortanzahl-Bericht\n"
+            "====================\n\n"
+            "Datei: a.docx\n"
+            "Gesamtwörter: 3\n"
+            "Einzigartige Wörter: 2\n"
+            "Top 10 Wörter:\n"
+            "  seo: 2\n"
+            "  text: 1\n"
+            "\n"
+            "Datei: b.docx\n"
+            "Fehler: kaputt\n\n"
+        )
+
+    @pytest.mark.unit
+    def test_count_words_separates_breaks_and_tabs(self):
+        """
+        Testet, dass Zeilenumbrüche und Tabs innerhalb eines Absatzes Wörter trennen.
+        """
+        from docx import Document
+        doc = Document()
+        paragraph = doc.add_paragraph("Hallo")
+        paragraph.add_run().add_break()
+        paragraph.add_run("Welt")
+        paragraph.add_run().add_tab()
+        paragraph.add_run("Tab")
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        
+        assert list(WordCounter.iter_paragraphs(buffer)) == ['Hallo\nWelt\tTab']
+        assert WordCounter.count_words(buffer)['total_words'] == 3
+
+    @pytest.mark.unit
+    def test_count_words_ignores_tables(self):
+        """
+        Testet, dass wie bei python-docx nur Absätze im Dokumentkörper zählen.
+        """
+        from docx import Document
+        doc = Document()
+        doc.add_paragraph("Vor der Tabelle")
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Zelle eins"
+        table.cell(0, 1).text = "Zelle zwei"
+        doc.add_paragraph("Danach")
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        
+        paragraphs = list(WordCounter.iter_paragraphs(buffer))
+        buffer.seek(0)
+        
+        assert paragraphs == [paragraph.text for paragraph in Document(buffer).paragraphs]
+        assert WordCounter.count_words(buffer)['total_words'] == 4